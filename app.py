@@ -1,9 +1,10 @@
 import streamlit as st
-import plotly.graph_objects as go
-import networkx as nx
-from src.topology_generator import NetworkTopologyGenerator
+import numpy as np
+import functools
 import json
-import pandas as pd
+import traceback
+from collections import defaultdict
+from pathlib import Path
 
 # Page configuration
 st.set_page_config(
@@ -14,30 +15,58 @@ st.set_page_config(
 )
 
 # Custom CSS for professional styling
-st.markdown("""
-<style>
-    .stMetric {
-        background-color: #f8f9fa;
-        padding: 15px;
-        border-radius: 10px;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-    }
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        padding-left: 20px;
-        padding-right: 20px;
-    }
-</style>
-""", unsafe_allow_html=True)
+CSS_PATH = Path(__file__).parent / "assets" / "style.css"
+
+
+@st.cache_resource
+def load_css(path):
+    """Read the stylesheet once per process"""
+    return f"<style>\n{Path(path).read_text()}</style>"
+
+
+st.markdown(load_css(CSS_PATH), unsafe_allow_html=True)
+
+# Static lookup tables
+NETWORK_TYPES = ("enterprise", "datacenter", "campus", "cloud", "hybrid")
+SECURITY_LEVELS = ("low", "medium", "high", "critical")
+
+DEVICE_ICONS = {
+    'router': '🛜',
+    'switch': '🔀',
+    'host': '💻',
+    'firewall': '🧱',
+    'ips': '🔒',
+    'cloud': '☁️'
+}
+DEFAULT_ICON = '📦'
+
+DEVICE_LABELS = {
+    'router': 'Router',
+    'switch': 'Switch',
+    'host': 'Host/PC',
+    'firewall': 'Firewall',
+    'ips': 'IPS/IDS',
+    'cloud': 'Cloud'
+}
+
+INVENTORY_COLUMNS = ('name', 'type', 'ip_address', 'model', 'subtype')
+
+# Topologies carry a unique id, so cached helpers key on it instead of
+# deep-hashing every device and link on each rerun
+TOPOLOGY_HASH_FUNCS = {dict: lambda topology: topology['id']}
+
+# Hosts drawn on the diagram; larger host rows are downsampled to this size
+MAX_DISPLAY_HOSTS = 30
+
+# Beyond this many labelled links, bandwidth is shown on hover instead of as text labels
+MAX_BANDWIDTH_LABELS = 30
+
+# Beyond this many devices, diagram icons carry no hover details
+MAX_HOVER_DEVICES = 50
 
 # Initialize session state
 if 'topology' not in st.session_state:
     st.session_state.topology = None
-if 'generator' not in st.session_state:
-    st.session_state.generator = None
 
 # Header
 st.title("🌐 Cisco Network Topology Simulator")
@@ -50,236 +79,297 @@ Perfect for network planning, documentation, and cybersecurity analysis.
 st.sidebar.header("⚙️ Topology Configuration")
 st.sidebar.markdown("---")
 
-network_type = st.sidebar.selectbox(
-    "🏢 Network Type",
-    ["enterprise", "datacenter", "campus", "cloud", "hybrid"],
-    help="Select the type of network infrastructure"
-)
-
-st.sidebar.markdown("### 📊 Network Size")
-num_routers = st.sidebar.slider("Routers", 1, 10, 3, help="Number of core routers")
-num_switches = st.sidebar.slider("Switches", 2, 20, 6, help="Distribution and access switches")
-num_hosts = st.sidebar.slider("Hosts/Endpoints", 5, 50, 20, help="End devices (PCs, servers)")
-
-st.sidebar.markdown("### 🛡️ Security & Optimization")
-security_level = st.sidebar.selectbox(
-    "Security Level",
-    ["low", "medium", "high", "critical"],
-    index=2,
-    help="Determines firewall and IPS placement"
-)
+# Generation inputs live in a form: adjusting them does not rerun the page,
+# only submitting does
+with st.sidebar.form("topology_config", border=False):
+    network_type = st.selectbox(
+        "🏢 Network Type",
+        NETWORK_TYPES,
+        help="Select the type of network infrastructure"
+    )
+    
+    st.markdown("### 📊 Network Size")
+    num_routers = st.slider("Routers", 1, 10, 3, help="Number of core routers")
+    num_switches = st.slider("Switches", 2, 20, 6, help="Distribution and access switches")
+    num_hosts = st.slider("Hosts/Endpoints", 5, 50, 20, help="End devices (PCs, servers)")
+    
+    st.markdown("### 🛡️ Security & Optimization")
+    security_level = st.selectbox(
+        "Security Level",
+        SECURITY_LEVELS,
+        index=2,
+        help="Determines firewall and IPS placement"
+    )
+    
+    redundancy = st.checkbox("Enable Redundancy", value=True, help="Add redundant links for high availability")
+    ai_optimize = st.checkbox("AI Optimization", value=True, help="Use AI to optimize topology design")
+    
+    generate_clicked = st.form_submit_button("🚀 Generate Topology", type="primary", use_container_width=True)
 
-redundancy = st.sidebar.checkbox("Enable Redundancy", value=True, help="Add redundant links for high availability")
-ai_optimize = st.sidebar.checkbox("AI Optimization", value=True, help="Use AI to optimize topology design")
+st.sidebar.markdown("---")
 show_bandwidth = st.sidebar.checkbox("Show Bandwidth Labels", value=True, help="Display link speeds on diagram")
 
-st.sidebar.markdown("---")
+@st.cache_data(show_spinner=False)
+def generate_topology_cached(network_type, num_routers, num_switches, num_hosts,
+                             security_level, redundancy, ai_optimize):
+    """Generate a topology, memoized on the sidebar parameters"""
+    from src.topology_generator import NetworkTopologyGenerator
+    
+    generator = NetworkTopologyGenerator()
+    return generator.generate_topology(
+        network_type=network_type,
+        num_routers=num_routers,
+        num_switches=num_switches,
+        num_hosts=num_hosts,
+        security_level=security_level,
+        redundancy=redundancy,
+        ai_optimize=ai_optimize
+    )
+
 
-# Generate topology button
-if st.sidebar.button("🚀 Generate Topology", type="primary", use_container_width=True):
+# Generate topology on form submit
+if generate_clicked:
     with st.spinner("🔄 Generating network topology..."):
         try:
-            generator = NetworkTopologyGenerator()
-            topology = generator.generate_topology(
-                network_type=network_type,
-                num_routers=num_routers,
-                num_switches=num_switches,
-                num_hosts=num_hosts,
-                security_level=security_level,
-                redundancy=redundancy,
-                ai_optimize=ai_optimize
+            topology = generate_topology_cached(
+                network_type,
+                num_routers,
+                num_switches,
+                num_hosts,
+                security_level,
+                redundancy,
+                ai_optimize
             )
             st.session_state.topology = topology
-            st.session_state.generator = generator
             st.success("✅ Topology generated successfully!")
         except Exception as e:
             st.error(f"❌ Error generating topology: {str(e)}")
             with st.expander("🔍 View Error Details"):
-                import traceback
                 st.code(traceback.format_exc())
 
 
+@functools.lru_cache(maxsize=None)
+def switch_tier(subtype):
+    """Classify a switch subtype as 'distribution', 'access' or '' (memoized per value)"""
+    subtype = subtype.lower()
+    if 'distribution' in subtype:
+        return 'distribution'
+    if 'access' in subtype:
+        return 'access'
+    return ''
+
+
+def layer_positions(layer, y, spacing):
+    """Center a row of devices horizontally at height y"""
+    n = len(layer)
+    xs = (np.arange(n) - (n - 1) / 2) * spacing
+    return dict(zip((d['name'] for d in layer), zip(xs.tolist(), [y] * n)))
+
+
+@st.cache_data(show_spinner=False, hash_funcs=TOPOLOGY_HASH_FUNCS)
 def compute_hierarchical_positions(topology):
-    """Compute deterministic 3-tier hierarchical layout"""
+    """Compute deterministic 3-tier hierarchical layout (cached per topology)"""
     devices = topology['devices']
     
-    routers = [d for d in devices if d['type'] == 'router']
-    switches = [d for d in devices if d['type'] == 'switch']
-    hosts = [d for d in devices if d['type'] == 'host']
-    firewalls = [d for d in devices if d['type'] == 'firewall']
-    ips_devices = [d for d in devices if d['type'] == 'ips']
-    clouds = [d for d in devices if d['type'] == 'cloud']
+    routers, switches, hosts, firewalls, ips_devices, clouds = [], [], [], [], [], []
+    dist_switches, access_switches = [], []
     
-    dist_switches = [s for s in switches if 'distribution' in s.get('subtype', '').lower()]
-    access_switches = [s for s in switches if 'access' in s.get('subtype', '').lower()]
+    # Bucket devices by type (and switches by tier) in a single pass
+    for d in devices:
+        device_type = d['type']
+        if device_type == 'host':
+            hosts.append(d)
+        elif device_type == 'switch':
+            switches.append(d)
+            tier = switch_tier(d.get('subtype', ''))
+            if tier == 'distribution':
+                dist_switches.append(d)
+            elif tier == 'access':
+                access_switches.append(d)
+        elif device_type == 'router':
+            routers.append(d)
+        elif device_type == 'firewall':
+            firewalls.append(d)
+        elif device_type == 'ips':
+            ips_devices.append(d)
+        elif device_type == 'cloud':
+            clouds.append(d)
     
     if not dist_switches and not access_switches and switches:
         mid = len(switches) // 2
         dist_switches = switches[:mid] if mid > 0 else []
         access_switches = switches[mid:] if mid < len(switches) else switches
     
-    pos = {}
     spacing_x = 4.5
     spacing_y = 4.0
     
+    pos = {}
     # Layer 0: Cloud
-    y_cloud = 5 * spacing_y
-    if clouds:
-        start_x = -spacing_x * (len(clouds) - 1) / 2
-        for i, cloud in enumerate(clouds):
-            pos[cloud['name']] = (start_x + i * spacing_x, y_cloud)
-    
+    pos.update(layer_positions(clouds, 5 * spacing_y, spacing_x))
     # Layer 1: Core Routers
-    y_core = 4 * spacing_y
-    if routers:
-        start_x = -spacing_x * (len(routers) - 1) / 2
-        for i, router in enumerate(routers):
-            pos[router['name']] = (start_x + i * spacing_x, y_core)
-    
+    pos.update(layer_positions(routers, 4 * spacing_y, spacing_x))
     # Layer 2: Security
-    y_security = 3.2 * spacing_y
-    security_devices = firewalls + ips_devices
-    if security_devices:
-        start_x = -spacing_x * (len(security_devices) - 1) / 2
-        for i, sec in enumerate(security_devices):
-            pos[sec['name']] = (start_x + i * spacing_x, y_security)
-    
+    pos.update(layer_positions(firewalls + ips_devices, 3.2 * spacing_y, spacing_x))
     # Layer 3: Distribution Switches
-    y_dist = 2.5 * spacing_y
-    if dist_switches:
-        start_x = -spacing_x * (len(dist_switches) - 1) / 2
-        for i, switch in enumerate(dist_switches):
-            pos[switch['name']] = (start_x + i * spacing_x, y_dist)
-    
+    pos.update(layer_positions(dist_switches, 2.5 * spacing_y, spacing_x))
     # Layer 4: Access Switches
-    y_access = 1.7 * spacing_y
-    if access_switches:
-        start_x = -spacing_x * (len(access_switches) - 1) / 2
-        for i, switch in enumerate(access_switches):
-            pos[switch['name']] = (start_x + i * spacing_x, y_access)
-    
-    # Layer 5: Hosts
-    y_host = 0.8 * spacing_y
-    max_hosts = min(30, len(hosts))
-    if hosts:
-        host_spacing_x = 3.0
-        start_x = -host_spacing_x * (max_hosts - 1) / 2
-        for i, host in enumerate(hosts[:max_hosts]):
-            pos[host['name']] = (start_x + i * host_spacing_x, y_host)
+    pos.update(layer_positions(access_switches, 1.7 * spacing_y, spacing_x))
+    # Layer 5: Hosts (every Nth host beyond MAX_DISPLAY_HOSTS, to keep the row readable)
+    step = -(-len(hosts) // MAX_DISPLAY_HOSTS) or 1
+    pos.update(layer_positions(hosts[::step], 0.8 * spacing_y, 3.0))
     
     return pos
 
 
-def create_cisco_diagram(topology, show_bandwidth=True):
-    """Create professional Cisco-style diagram with emoji icons"""
-    
-    # Icon mapping
-    icon_map = {
-        'router': '🛜',
-        'switch': '🔀',
-        'host': '💻',
-        'firewall': '🧱',
-        'ips': '🔒',
-        'cloud': '☁️'
-    }
-    
-    G = nx.Graph()
-    
-    for device in topology['devices']:
-        G.add_node(device['name'], **device)
-    
-    for link in topology['links']:
-        G.add_edge(link['source'], link['target'], **link)
+@st.cache_data(show_spinner=False, hash_funcs=TOPOLOGY_HASH_FUNCS)
+def create_cisco_diagram(topology):
+    """Create professional Cisco-style diagram with emoji icons (cached per topology)"""
+    import plotly.graph_objects as go
     
     pos = compute_hierarchical_positions(topology)
     
-    fig = go.Figure()
-    
-    # Draw connection lines
-    for u, v, data in G.edges(data=True):
-        if u not in pos or v not in pos:
-            continue
-        
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        
-        fig.add_trace(go.Scatter(
-            x=[x0, x1],
-            y=[y0, y1],
-            mode='lines',
-            line=dict(color='#4B5563', width=2.5),
-            hoverinfo='none',
-            showlegend=False
-        ))
-        
-        if show_bandwidth:
-            bandwidth = data.get('bandwidth', '')
-            if bandwidth:
-                mid_x, mid_y = (x0 + x1) / 2, (y0 + y1) / 2
-                
-                fig.add_annotation(
-                    x=mid_x,
-                    y=mid_y,
-                    text=f"<b>{bandwidth}</b>",
-                    showarrow=False,
-                    font=dict(size=10, family='Courier New, monospace', color='#DC2626'),
-                    bgcolor='rgba(255, 255, 255, 0.95)',
-                    bordercolor='#E5E7EB',
-                    borderwidth=1,
-                    borderpad=3,
-                    opacity=0.95
-                )
-    
-    # Draw device icons
-    for node in G.nodes():
-        if node not in pos:
-            continue
-        
-        x, y = pos[node]
-        node_data = G.nodes[node]
-        device_type = node_data['type']
-        ip_addr = node_data.get('ip_address', '')
-        model = node_data.get('model', 'N/A')
-        
-        device_icon = icon_map.get(device_type, '📦')
-        
-        fig.add_trace(go.Scatter(
-            x=[x],
-            y=[y],
+    traces = []
+    
+    # Parallel coordinate array, addressed by integer index instead of name
+    index = {name: i for i, name in enumerate(pos)}
+    coords = np.array(list(pos.values()), dtype=float).reshape(-1, 2)
+    
+    # Draw connection lines as a single trace, NaN-separated per segment
+    edges = [
+        link for link in topology['links']
+        if link['source'] in index and link['target'] in index
+    ]
+    
+    src = coords[np.fromiter((index[link['source']] for link in edges), dtype=np.intp, count=len(edges))]
+    dst = coords[np.fromiter((index[link['target']] for link in edges), dtype=np.intp, count=len(edges))]
+    gaps = np.full(len(edges), np.nan)
+    
+    edge_x = np.column_stack([src[:, 0], dst[:, 0], gaps]).ravel()
+    edge_y = np.column_stack([src[:, 1], dst[:, 1], gaps]).ravel()
+    
+    # Lines are the bulk of the points, so draw them with WebGL; the text
+    # traces stay SVG because scattergl cannot render the emoji icons
+    traces.append(go.Scattergl(
+        x=edge_x,
+        y=edge_y,
+        mode='lines',
+        line=dict(color='#4B5563', width=2.5),
+        hoverinfo='skip'
+    ))
+    
+    # Bandwidth labels get their own named trace so the sidebar toggle only
+    # flips its visibility instead of rebuilding the figure
+    has_bandwidth = np.fromiter((bool(link.get('bandwidth')) for link in edges), dtype=bool, count=len(edges))
+    midpoints = (src[has_bandwidth] + dst[has_bandwidth]) * 0.5
+    bandwidth_text = [f"<b>{link['bandwidth']}</b>" for link in edges if link.get('bandwidth')]
+    
+    if len(bandwidth_text) > MAX_BANDWIDTH_LABELS:
+        # Too many labels to read; put them on invisible hover targets instead
+        bandwidth_style = dict(
+            mode='markers',
+            marker=dict(size=10, opacity=0),
+            hovertext=bandwidth_text,
+            hoverinfo='text'
+        )
+    else:
+        bandwidth_style = dict(
             mode='text',
-            text=[device_icon],
-            textfont=dict(size=50),
-            hovertext=(
+            text=bandwidth_text,
+            textposition='middle center',
+            textfont=dict(size=10, family='Courier New, monospace', color='#DC2626'),
+            hoverinfo='skip'
+        )
+    
+    traces.append(go.Scatter(
+        x=midpoints[:, 0],
+        y=midpoints[:, 1],
+        name='bandwidth',
+        cliponaxis=False,
+        **bandwidth_style
+    ))
+    
+    # Draw device icons as a single text trace
+    nodes = [(device['name'], device) for device in topology['devices'] if device['name'] in pos]
+    node_x = [pos[node][0] for node, _ in nodes]
+    node_y = [pos[node][1] for node, _ in nodes]
+    
+    if len(topology['devices']) > MAX_HOVER_DEVICES:
+        # Large topologies skip per-device hover; the inventory tab lists the details
+        node_hover = dict(hoverinfo='skip')
+    else:
+        node_hover = dict(
+            hovertext=[
                 f"<b>{node}</b><br>"
                 f"─────────────────<br>"
-                f"<b>Type:</b> {device_type.upper()}<br>"
-                f"<b>IP:</b> {ip_addr}<br>"
-                f"<b>Model:</b> {model}"
-            ),
+                f"<b>Type:</b> {node_data['type'].upper()}<br>"
+                f"<b>IP:</b> {node_data.get('ip_address', '')}<br>"
+                f"<b>Model:</b> {node_data.get('model', 'N/A')}"
+                for node, node_data in nodes
+            ],
+            hoverinfo='text'
+        )
+    
+    traces.append(go.Scatter(
+        x=node_x,
+        y=node_y,
+        mode='text',
+        text=[DEVICE_ICONS.get(node_data['type'], DEFAULT_ICON) for _, node_data in nodes],
+        textfont=dict(size=50),
+        **node_hover
+    ))
+    
+    # Device name labels below each icon
+    traces.append(go.Scatter(
+        x=node_x,
+        y=[y - 0.55 for y in node_y],
+        mode='text',
+        text=[f"<b>{node}</b>" for node, _ in nodes],
+        textposition='bottom center',
+        textfont=dict(size=11, family='Arial, sans-serif', color='#1F2937'),
+        hoverinfo='skip',
+        cliponaxis=False
+    ))
+    
+    # IP labels for infrastructure devices
+    addressed = [
+        (x, y, node_data.get('ip_address', ''))
+        for (_, node_data), x, y in zip(nodes, node_x, node_y)
+        if node_data['type'] in ['router', 'switch', 'firewall', 'ips']
+    ]
+    
+    traces.append(go.Scatter(
+        x=[x for x, _, _ in addressed],
+        y=[y - 0.85 for _, y, _ in addressed],
+        mode='text',
+        text=[ip_addr for _, _, ip_addr in addressed],
+        textposition='bottom center',
+        textfont=dict(size=9, family='Courier New, monospace', color='#6B7280'),
+        hoverinfo='skip',
+        cliponaxis=False
+    ))
+    
+    # Summarize downsampled hosts with a single glyph at the end of the host row
+    host_xy = [pos[node] for node, node_data in nodes if node_data['type'] == 'host']
+    hidden_hosts = sum(1 for device in topology['devices'] if device['type'] == 'host') - len(host_xy)
+    
+    if hidden_hosts > 0:
+        traces.append(go.Scatter(
+            x=[max(x for x, _ in host_xy) + 3.0],
+            y=[host_xy[0][1]],
+            mode='text',
+            text=[f"💻×{hidden_hosts}"],
+            textfont=dict(size=20, color='#6B7280'),
+            hovertext=[f"{hidden_hosts} more hosts not shown"],
             hoverinfo='text',
-            showlegend=False
+            cliponaxis=False
         ))
-        
-        fig.add_annotation(
-            x=x,
-            y=y - 0.55,
-            text=f"<b>{node}</b>",
-            showarrow=False,
-            font=dict(size=11, family='Arial, sans-serif', color='#1F2937'),
-            yanchor='top'
-        )
-        
-        if device_type in ['router', 'switch', 'firewall', 'ips']:
-            fig.add_annotation(
-                x=x,
-                y=y - 0.85,
-                text=ip_addr,
-                showarrow=False,
-                font=dict(size=9, family='Courier New, monospace', color='#6B7280'),
-                yanchor='top'
-            )
     
-    fig.update_layout(
+    # Widen the view to the layout so wide rows (e.g. 30 hosts) stay on screen
+    x_extent = max(22.0, float(np.abs(coords[:, 0]).max()) + 2.5) if len(coords) else 22.0
+    if hidden_hosts > 0:
+        x_extent += 3.0
+    
+    layout = go.Layout(
         title=dict(
             text=f"<b>{topology['network_type'].upper()} Network Topology</b>",
             font=dict(size=26, color='#111827', family='Arial Black, sans-serif'),
@@ -292,24 +382,27 @@ def create_cisco_diagram(topology, show_bandwidth=True):
         hovermode='closest',
         plot_bgcolor='#F9FAFB',
         paper_bgcolor='#FFFFFF',
-        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False, range=[-22, 22]),
-        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False, range=[-1, 22]),
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False, range=[-x_extent, x_extent], autorange=False, fixedrange=True),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False, range=[-1, 22], autorange=False, fixedrange=True),
         height=900,
         margin=dict(l=50, r=50, t=100, b=50)
     )
     
-    return fig
+    return go.Figure(data=traces, layout=layout)
 
 
+@st.cache_data(show_spinner=False, hash_funcs=TOPOLOGY_HASH_FUNCS)
 def generate_cisco_commands(topology):
-    """Generate Cisco IOS commands for Packet Tracer"""
+    """Generate Cisco IOS commands for Packet Tracer (cached per topology)"""
     commands = {}
     
-    G = nx.Graph()
-    for device in topology['devices']:
-        G.add_node(device['name'], **device)
+    device_types = {device['name']: device['type'] for device in topology['devices']}
+    
+    # Neighbors in link order, de-duplicated (dict keys act as an ordered set)
+    adjacency = defaultdict(dict)
     for link in topology['links']:
-        G.add_edge(link['source'], link['target'], **link)
+        adjacency[link['source']][link['target']] = None
+        adjacency[link['target']][link['source']] = None
     
     interface_counter = {}
     
@@ -346,7 +439,7 @@ def generate_cisco_commands(topology):
 """
             continue
         
-        config = f"""! Configuration for {device_name}
+        config = [f"""! Configuration for {device_name}
 enable
 configure terminal
 hostname {device_name}
@@ -354,10 +447,10 @@ no ip domain-lookup
 service password-encryption
 enable secret cisco123
 
-"""
+"""]
         
         if device_type == 'router':
-            config += """line console 0
+            config.append("""line console 0
  password cisco
  login
  logging synchronous
@@ -368,31 +461,30 @@ line vty 0 4
  login
  exit
 
-"""
-            neighbors = list(G.neighbors(device_name))
-            for neighbor in neighbors:
+""")
+            for neighbor in adjacency[device_name]:
                 interface = get_next_interface(device_name, device_type)
                 
                 if ip_address:
                     ip_parts = ip_address.split('.')
                     interface_ip = f"{ip_parts[0]}.{ip_parts[1]}.{int(ip_parts[2])+1}.{ip_parts[3]}"
                     
-                    config += f"""interface {interface}
+                    config.append(f"""interface {interface}
  description Connection to {neighbor}
  ip address {interface_ip} 255.255.255.0
  no shutdown
  exit
 
-"""
+""")
             
-            config += f"""router ospf 1
+            config.append(f"""router ospf 1
  network {ip_address} 0.0.0.255 area 0
  exit
 
-"""
+""")
         
         elif device_type == 'switch':
-            config += """line console 0
+            config.append("""line console 0
  password cisco
  login
  exit
@@ -415,22 +507,20 @@ interface vlan 99
  no shutdown
  exit
 
-"""
-            neighbors = list(G.neighbors(device_name))
-            for neighbor in neighbors:
-                neighbor_data = G.nodes[neighbor]
+""")
+            for neighbor in adjacency[device_name]:
                 interface = get_next_interface(device_name, device_type)
                 
-                if neighbor_data['type'] in ['router', 'switch']:
-                    config += f"""interface {interface}
+                if device_types[neighbor] in ['router', 'switch']:
+                    config.append(f"""interface {interface}
  description Trunk to {neighbor}
  switchport mode trunk
  no shutdown
  exit
 
-"""
+""")
                 else:
-                    config += f"""interface {interface}
+                    config.append(f"""interface {interface}
  description Access to {neighbor}
  switchport mode access
  switchport access vlan 10
@@ -438,17 +528,150 @@ interface vlan 99
  no shutdown
  exit
 
-"""
+""")
         
-        config += """end
+        config.append("""end
 write memory
-"""
+""")
         
-        commands[device_name] = config
+        commands[device_name] = "".join(config)
     
     return commands
 
 
+@st.cache_data(show_spinner=False, hash_funcs=TOPOLOGY_HASH_FUNCS)
+def build_inventory_tables(topology):
+    """Build the per-type Device Inventory tables (cached per topology)"""
+    import pandas as pd
+    
+    all_devices = pd.DataFrame(topology['devices'])
+    cols_to_show = [col for col in INVENTORY_COLUMNS if col in all_devices.columns]
+    
+    tables = {}
+    for dev_type, group in all_devices[cols_to_show].groupby('type', sort=True):
+        # Drop columns no device of this type fills in
+        tables[dev_type] = group.dropna(axis=1, how='all')
+    
+    return tables
+
+
+@st.cache_data(show_spinner=False, hash_funcs=TOPOLOGY_HASH_FUNCS)
+def build_links_table(topology):
+    """Build the Network Links table (cached per topology)"""
+    import pandas as pd
+    
+    return pd.DataFrame(topology['links'])
+
+
+@st.cache_data(show_spinner=False, ttl=300, hash_funcs=TOPOLOGY_HASH_FUNCS)
+def export_topology_json(topology):
+    """Serialize the topology for download; cached so reruns don't re-encode it"""
+    return json.dumps(topology, indent=2).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False, ttl=300, hash_funcs=TOPOLOGY_HASH_FUNCS)
+def export_all_commands(topology):
+    """Join every device's commands for download; cached so reruns don't rebuild it"""
+    return "\n\n".join(
+        f"{'='*60}\nDevice: {name}\n{'='*60}\n{cmd}\n"
+        for name, cmd in generate_cisco_commands(topology).items()
+    )
+
+
+@st.fragment
+def render_diagram_tab(topology, show_bandwidth):
+    """Render the Topology Diagram tab; reruns scoped to this fragment"""
+    st.markdown("### 🎨 Network Topology Visualization")
+    
+    try:
+        # Reuse the figure already built for this topology in this session
+        fig_cache = st.session_state.setdefault('fig_cache', {})
+        if topology['id'] not in fig_cache:
+            fig_cache.clear()
+            fig_cache[topology['id']] = create_cisco_diagram(topology)
+        fig = fig_cache[topology['id']]
+        fig.update_traces(visible=show_bandwidth, selector=dict(name='bandwidth'))
+        # A stable key keeps the same chart element across reruns, so the front
+        # end updates it in place instead of tearing the plot down
+        st.plotly_chart(fig, use_container_width=True, key='topology_chart', config={'displaylogo': False})
+        
+        st.markdown("---")
+        st.markdown("### 🎨 Device Legend")
+        for col, (dev_type, icon) in zip(st.columns(len(DEVICE_ICONS)), DEVICE_ICONS.items()):
+            with col:
+                st.markdown(f"{icon} **{DEVICE_LABELS[dev_type]}**")
+            
+    except Exception as e:
+        st.error(f"❌ Error: {str(e)}")
+        with st.expander("🔍 Details"):
+            st.code(traceback.format_exc())
+
+
+@st.fragment
+def render_inventory_tab(topology):
+    """Render the Device Inventory tab; reruns scoped to this fragment"""
+    st.markdown("### 📋 Complete Device Inventory")
+    
+    for dev_type, df in build_inventory_tables(topology).items():
+        icon = DEVICE_ICONS.get(dev_type, DEFAULT_ICON)
+        with st.expander(f"{icon} **{dev_type.upper()}** ({len(df)} devices)", expanded=True):
+            st.dataframe(df, use_container_width=True, hide_index=True)
+
+
+@st.fragment
+def render_links_tab(topology):
+    """Render the Network Links tab; reruns scoped to this fragment"""
+    st.markdown("### 🔗 Network Connection Matrix")
+    
+    links_df = build_links_table(topology)
+    st.dataframe(links_df, use_container_width=True, height=400)
+
+
+@st.fragment
+def render_export_tab(topology):
+    """Render the Export & Config tab; reruns scoped to this fragment"""
+    st.markdown("### 💾 Export Options")
+    
+    json_data = export_topology_json(topology)
+    st.download_button(
+        "📥 Download JSON",
+        json_data,
+        f"{topology['network_type']}_topology.json",
+        "application/json"
+    )
+
+
+@st.fragment
+def render_commands_tab(topology):
+    """Render the Cisco Commands tab; reruns scoped to this fragment"""
+    st.markdown("### 🖥️ Cisco Packet Tracer Configuration Commands")
+    
+    cisco_commands = generate_cisco_commands(topology)
+    
+    # Show one device at a time; the download below covers every device
+    device_types = {device['name']: device['type'] for device in topology['devices']}
+    configured = [
+        name for dev_type in ['router', 'switch', 'firewall', 'ips']
+        for name in cisco_commands
+        if device_types.get(name) == dev_type
+    ]
+    
+    if configured:
+        selected = st.selectbox(
+            "Device",
+            configured,
+            format_func=lambda name: f"{DEVICE_ICONS.get(device_types[name], DEFAULT_ICON)} {name} ({device_types[name].upper()})"
+        )
+        st.code(cisco_commands[selected], language='cisco')
+    
+    st.download_button(
+        "📥 Download All Commands",
+        export_all_commands(topology),
+        f"cisco_config_{topology['network_type']}.txt",
+        "text/plain"
+    )
+
+
 # Main Application
 if st.session_state.topology is not None:
     topology = st.session_state.topology
@@ -476,110 +699,19 @@ if st.session_state.topology is not None:
     ])
     
     with tab1:
-        st.markdown("### 🎨 Network Topology Visualization")
-        
-        try:
-            fig = create_cisco_diagram(topology, show_bandwidth)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            st.markdown("---")
-            st.markdown("### 🎨 Device Legend")
-            cols = st.columns(6)
-            with cols[0]:
-                st.markdown("🛜 **Router**")
-            with cols[1]:
-                st.markdown("🔀 **Switch**")
-            with cols[2]:
-                st.markdown("💻 **Host/PC**")
-            with cols[3]:
-                st.markdown("🧱 **Firewall**")
-            with cols[4]:
-                st.markdown("🔒 **IPS/IDS**")
-            with cols[5]:
-                st.markdown("☁️ **Cloud**")
-                
-        except Exception as e:
-            st.error(f"❌ Error: {str(e)}")
-            with st.expander("🔍 Details"):
-                import traceback
-                st.code(traceback.format_exc())
+        render_diagram_tab(topology, show_bandwidth)
     
     with tab2:
-        st.markdown("### 📋 Complete Device Inventory")
-        
-        device_types = {}
-        for device in topology['devices']:
-            dev_type = device['type']
-            if dev_type not in device_types:
-                device_types[dev_type] = []
-            device_types[dev_type].append(device)
-        
-        type_icons = {'router': '🛜', 'switch': '🔀', 'host': '💻', 'firewall': '🧱', 'ips': '🔒', 'cloud': '☁️'}
-        
-        for dev_type, devices in sorted(device_types.items()):
-            icon = type_icons.get(dev_type, '📦')
-            with st.expander(f"{icon} **{dev_type.upper()}** ({len(devices)} devices)", expanded=True):
-                df = pd.DataFrame(devices)
-                
-                # Fix for missing columns
-                cols_to_show = ['name', 'type']
-                if 'ip_address' in df.columns:
-                    cols_to_show.append('ip_address')
-                if 'model' in df.columns:
-                    cols_to_show.append('model')
-                if 'subtype' in df.columns:
-                    cols_to_show.append('subtype')
-                
-                st.dataframe(df[cols_to_show], use_container_width=True, hide_index=True)
+        render_inventory_tab(topology)
     
     with tab3:
-        st.markdown("### 🔗 Network Connection Matrix")
-        
-        links_df = pd.DataFrame(topology['links'])
-        st.dataframe(links_df, use_container_width=True, height=400)
+        render_links_tab(topology)
     
     with tab4:
-        st.markdown("### 💾 Export Options")
-        
-        if st.session_state.generator:
-            json_data = st.session_state.generator.get_topology_json()
-            st.download_button(
-                "📥 Download JSON",
-                json_data,
-                f"{network_type}_topology.json",
-                "application/json"
-            )
+        render_export_tab(topology)
     
     with tab5:
-        st.markdown("### 🖥️ Cisco Packet Tracer Configuration Commands")
-        
-        cisco_commands = generate_cisco_commands(topology)
-        
-        for dev_type in ['router', 'switch', 'firewall', 'ips']:
-            devices = [d for d in topology['devices'] if d['type'] == dev_type]
-            if not devices:
-                continue
-            
-            type_icons = {'router': '🛜', 'switch': '🔀', 'firewall': '🧱', 'ips': '🔒'}
-            icon = type_icons.get(dev_type, '📦')
-            
-            with st.expander(f"{icon} **{dev_type.upper()}** ({len(devices)} devices)", expanded=True):
-                for device in devices:
-                    if device['name'] in cisco_commands:
-                        st.markdown(f"##### {device['name']}")
-                        st.code(cisco_commands[device['name']], language='cisco')
-        
-        all_commands = "\n\n".join([
-            f"{'='*60}\nDevice: {name}\n{'='*60}\n{cmd}\n"
-            for name, cmd in cisco_commands.items()
-        ])
-        
-        st.download_button(
-            "📥 Download All Commands",
-            all_commands,
-            f"cisco_config_{network_type}.txt",
-            "text/plain"
-        )
+        render_commands_tab(topology)
 
 else:
     st.info("👈 Configure and generate your topology using the sidebar")
@@ -6,6 +6,61 @@ Performance analysis and monitoring
 from typing import Dict
 import random
 
+# Simulated performance metrics: (name, low, high, decimals)
+_PERFORMANCE_METRICS = (
+    ('average_latency_ms', 10, 20, 2),
+    ('peak_latency_ms', 25, 40, 2),
+    ('throughput_gbps', 2.0, 3.5, 2),
+    ('packet_loss_percent', 0.01, 0.05, 3),
+    ('jitter_ms', 1, 5, 2),
+    ('availability_percent', 99.9, 99.99, 2)
+)
+
+# Protocol traffic shares in percent: (protocol, low, high)
+_PROTOCOL_SHARES = (
+    ('HTTP', 30, 40),
+    ('HTTPS', 35, 45),
+    ('SSH', 5, 15),
+    ('FTP', 2, 8),
+    ('DNS', 3, 7),
+    ('Other', 3, 10)
+)
+
+# Top talkers and their traffic range in GB: (device, low, high)
+_TOP_TALKERS = (
+    ('Router-core-01', 100, 300),
+    ('Switch-distribution-01', 80, 250),
+    ('Firewall-01', 70, 200)
+)
+
+_BOTTLENECKS = (
+    {
+        'location': 'Switch-distribution-02',
+        'type': 'Bandwidth Saturation',
+        'severity': 'High',
+        'utilization': '92%',
+        'recommendation': 'Upgrade to 10Gbps uplink'
+    },
+    {
+        'location': 'Router-core-01 to Switch-distribution-01',
+        'type': 'High Latency',
+        'severity': 'Medium',
+        'latency': '45ms',
+        'recommendation': 'Check for routing loops or misconfigurations'
+    }
+)
+
+_OPTIMIZATION_SUGGESTIONS = (
+    'Implement QoS policies for critical applications',
+    'Enable link aggregation on high-traffic switches',
+    'Optimize routing protocols for faster convergence',
+    'Deploy caching servers to reduce WAN traffic',
+    'Implement traffic shaping for bandwidth management',
+    'Upgrade core router interfaces to 10Gbps',
+    'Enable jumbo frames for improved throughput',
+    'Implement load balancing across redundant paths'
+)
+
 
 class NetworkAnalytics:
     """Analyze network performance and generate insights"""
@@ -32,12 +87,8 @@ class NetworkAnalytics:
     def _analyze_performance(self) -> Dict:
         """Analyze network performance metrics"""
         return {
-            'average_latency_ms': round(random.uniform(10, 20), 2),
-            'peak_latency_ms': round(random.uniform(25, 40), 2),
-            'throughput_gbps': round(random.uniform(2.0, 3.5), 2),
-            'packet_loss_percent': round(random.uniform(0.01, 0.05), 3),
-            'jitter_ms': round(random.uniform(1, 5), 2),
-            'availability_percent': round(random.uniform(99.9, 99.99), 2)
+            name: round(random.uniform(low, high), decimals)
+            for name, low, high, decimals in _PERFORMANCE_METRICS
         }
     
     def _analyze_traffic(self) -> Dict:
@@ -46,17 +97,11 @@ class NetworkAnalytics:
             'total_traffic_gb': round(random.uniform(1000, 5000), 2),
             'peak_hour_traffic_gb': round(random.uniform(200, 500), 2),
             'protocol_distribution': {
-                'HTTP': random.randint(30, 40),
-                'HTTPS': random.randint(35, 45),
-                'SSH': random.randint(5, 15),
-                'FTP': random.randint(2, 8),
-                'DNS': random.randint(3, 7),
-                'Other': random.randint(3, 10)
+                protocol: random.randint(low, high) for protocol, low, high in _PROTOCOL_SHARES
             },
             'top_talkers': [
-                {'device': 'Router-core-01', 'traffic_gb': round(random.uniform(100, 300), 2)},
-                {'device': 'Switch-distribution-01', 'traffic_gb': round(random.uniform(80, 250), 2)},
-                {'device': 'Firewall-01', 'traffic_gb': round(random.uniform(70, 200), 2)}
+                {'device': device, 'traffic_gb': round(random.uniform(low, high), 2)}
+                for device, low, high in _TOP_TALKERS
             ]
         }
     
@@ -64,13 +109,14 @@ class NetworkAnalytics:
         """Analyze network capacity and utilization"""
         devices = self.topology.get('devices', [])
         
-        utilization_data = []
-        for device in devices[:10]:  # Top 10 devices
-            utilization_data.append({
+        utilization_data = [
+            {
                 'device': device['name'],
                 'utilization_percent': random.randint(40, 85),
                 'capacity_remaining_percent': random.randint(15, 60)
-            })
+            }
+            for device in devices[:10]  # Top 10 devices
+        ]
         
         return {
             'overall_utilization_percent': random.randint(60, 75),
@@ -85,34 +131,8 @@ class NetworkAnalytics:
     
     def _detect_bottlenecks(self) -> list:
         """Detect network bottlenecks"""
-        bottlenecks = [
-            {
-                'location': 'Switch-distribution-02',
-                'type': 'Bandwidth Saturation',
-                'severity': 'High',
-                'utilization': '92%',
-                'recommendation': 'Upgrade to 10Gbps uplink'
-            },
-            {
-                'location': 'Router-core-01 to Switch-distribution-01',
-                'type': 'High Latency',
-                'severity': 'Medium',
-                'latency': '45ms',
-                'recommendation': 'Check for routing loops or misconfigurations'
-            }
-        ]
-        
-        return bottlenecks
+        return [dict(bottleneck) for bottleneck in _BOTTLENECKS]
     
     def _generate_suggestions(self) -> list:
         """Generate optimization suggestions"""
-        return [
-            'Implement QoS policies for critical applications',
-            'Enable link aggregation on high-traffic switches',
-            'Optimize routing protocols for faster convergence',
-            'Deploy caching servers to reduce WAN traffic',
-            'Implement traffic shaping for bandwidth management',
-            'Upgrade core router interfaces to 10Gbps',
-            'Enable jumbo frames for improved throughput',
-            'Implement load balancing across redundant paths'
-        ]
+        return list(_OPTIMIZATION_SUGGESTIONS)
@@ -3,9 +3,33 @@ Cloud Network Integrator
 Hybrid cloud network design and integration
 """
 
-from typing import Dict, List
+from typing import Dict, List, Sequence
 import random
 
+# Monthly pricing per provider (USD)
+_BASE_COSTS = {
+    'aws': {
+        'vpn_gateway': 36.00,  # per month
+        'data_transfer_per_gb': 0.09,
+        'connection_hour': 0.05
+    },
+    'azure': {
+        'vpn_gateway': 27.00,
+        'data_transfer_per_gb': 0.087,
+        'connection_hour': 0.04
+    },
+    'gcp': {
+        'vpn_gateway': 36.50,
+        'data_transfer_per_gb': 0.085,
+        'connection_hour': 0.05
+    }
+}
+
+_HOURS_PER_MONTH = 730
+
+# GB transferred per month for each Mbps of bandwidth at 70% utilization
+_GB_PER_MBPS_MONTH = (0.7 * _HOURS_PER_MONTH * 3600) / (8 * 1024 * 1024 * 1024)
+
 
 class CloudNetworkBuilder:
     """Build hybrid cloud network architectures"""
@@ -39,8 +63,10 @@ class CloudNetworkBuilder:
         vpn_config = self._configure_vpn(integration_type, vpn_encryption, bandwidth)
         routing_config = self._configure_routing(on_premise, cloud_resources)
         
+        deployment_id, = self._draw_ids((4,))
+        
         hybrid_config = {
-            'deployment_id': f'hybrid-{random.randint(1000, 9999)}',
+            'deployment_id': f'hybrid-{deployment_id}',
             'cloud_provider': cloud_provider,
             'integration_type': integration_type,
             'on_premise_network': {
@@ -59,45 +85,51 @@ class CloudNetworkBuilder:
         
         return hybrid_config
     
+    def _draw_ids(self, digits: Sequence[int]) -> List[int]:
+        """Draw one random resource ID per entry in digits, with that many digits"""
+        return [random.randint(10 ** (n - 1), 10 ** n - 1) for n in digits]
+    
     def _provision_cloud_resources(self, provider: str, bandwidth: int) -> Dict:
         """Provision cloud network resources"""
         
         if provider == "aws":
+            vpc_id, public_subnet_id, private_subnet_id, vgw_id, cgw_id, sg_id = self._draw_ids((6, 6, 6, 6, 6, 6))
+            
             return {
                 'vpc': {
-                    'vpc_id': f'vpc-{random.randint(100000, 999999)}',
+                    'vpc_id': f'vpc-{vpc_id}',
                     'cidr_block': '172.16.0.0/16',
                     'region': 'us-east-1',
                     'availability_zones': ['us-east-1a', 'us-east-1b']
                 },
                 'subnets': [
                     {
-                        'subnet_id': f'subnet-{random.randint(100000, 999999)}',
+                        'subnet_id': f'subnet-{public_subnet_id}',
                         'cidr_block': '172.16.1.0/24',
                         'type': 'public',
                         'az': 'us-east-1a'
                     },
                     {
-                        'subnet_id': f'subnet-{random.randint(100000, 999999)}',
+                        'subnet_id': f'subnet-{private_subnet_id}',
                         'cidr_block': '172.16.2.0/24',
                         'type': 'private',
                         'az': 'us-east-1a'
                     }
                 ],
                 'vpn_gateway': {
-                    'gateway_id': f'vgw-{random.randint(100000, 999999)}',
+                    'gateway_id': f'vgw-{vgw_id}',
                     'type': 'ipsec.1',
                     'amazon_side_asn': 64512
                 },
                 'customer_gateway': {
-                    'gateway_id': f'cgw-{random.randint(100000, 999999)}',
+                    'gateway_id': f'cgw-{cgw_id}',
                     'type': 'ipsec.1',
                     'bgp_asn': 65000,
                     'ip_address': '203.0.113.1'
                 },
                 'security_groups': [
                     {
-                        'group_id': f'sg-{random.randint(100000, 999999)}',
+                        'group_id': f'sg-{sg_id}',
                         'name': 'vpn-security-group',
                         'rules': [
                             {'protocol': 'udp', 'port': 500, 'source': '0.0.0.0/0'},
@@ -108,39 +140,41 @@ class CloudNetworkBuilder:
             }
         
         elif provider == "azure":
+            vnet_id, gateway_subnet_id, default_subnet_id, vpngw_id, lng_id, nsg_id = self._draw_ids((4, 6, 6, 6, 6, 6))
+            
             return {
                 'virtual_network': {
-                    'vnet_id': f'/subscriptions/xxx/resourceGroups/rg/providers/Microsoft.Network/virtualNetworks/vnet-{random.randint(1000, 9999)}',
+                    'vnet_id': f'/subscriptions/xxx/resourceGroups/rg/providers/Microsoft.Network/virtualNetworks/vnet-{vnet_id}',
                     'address_space': '172.16.0.0/16',
                     'region': 'eastus',
                     'resource_group': 'hybrid-network-rg'
                 },
                 'subnets': [
                     {
-                        'subnet_id': f'subnet-{random.randint(100000, 999999)}',
+                        'subnet_id': f'subnet-{gateway_subnet_id}',
                         'address_prefix': '172.16.1.0/24',
                         'type': 'GatewaySubnet'
                     },
                     {
-                        'subnet_id': f'subnet-{random.randint(100000, 999999)}',
+                        'subnet_id': f'subnet-{default_subnet_id}',
                         'address_prefix': '172.16.2.0/24',
                         'type': 'default'
                     }
                 ],
                 'vpn_gateway': {
-                    'gateway_id': f'vpngw-{random.randint(100000, 999999)}',
+                    'gateway_id': f'vpngw-{vpngw_id}',
                     'sku': 'VpnGw1',
                     'vpn_type': 'RouteBased',
                     'generation': 'Generation1'
                 },
                 'local_network_gateway': {
-                    'gateway_id': f'lng-{random.randint(100000, 999999)}',
+                    'gateway_id': f'lng-{lng_id}',
                     'gateway_ip': '203.0.113.1',
                     'address_space': '10.0.0.0/8'
                 },
                 'network_security_groups': [
                     {
-                        'nsg_id': f'nsg-{random.randint(100000, 999999)}',
+                        'nsg_id': f'nsg-{nsg_id}',
                         'name': 'vpn-nsg',
                         'rules': [
                             {'name': 'AllowVPN', 'protocol': 'UDP', 'port': '500,4500'}
@@ -150,38 +184,40 @@ class CloudNetworkBuilder:
             }
         
         elif provider == "gcp":
+            network_id, subnet_1_id, subnet_2_id, vpn_gw_id, tunnel_id, fw_id = self._draw_ids((4, 6, 6, 6, 6, 6))
+            
             return {
                 'vpc_network': {
-                    'network_id': f'projects/project-id/global/networks/vpc-{random.randint(1000, 9999)}',
+                    'network_id': f'projects/project-id/global/networks/vpc-{network_id}',
                     'auto_create_subnetworks': False,
                     'routing_mode': 'REGIONAL'
                 },
                 'subnets': [
                     {
-                        'subnet_id': f'subnet-{random.randint(100000, 999999)}',
+                        'subnet_id': f'subnet-{subnet_1_id}',
                         'ip_cidr_range': '172.16.1.0/24',
                         'region': 'us-central1'
                     },
                     {
-                        'subnet_id': f'subnet-{random.randint(100000, 999999)}',
+                        'subnet_id': f'subnet-{subnet_2_id}',
                         'ip_cidr_range': '172.16.2.0/24',
                         'region': 'us-central1'
                     }
                 ],
                 'vpn_gateway': {
-                    'gateway_id': f'vpn-gw-{random.randint(100000, 999999)}',
+                    'gateway_id': f'vpn-gw-{vpn_gw_id}',
                     'network': 'vpc-network',
                     'region': 'us-central1'
                 },
                 'vpn_tunnel': {
-                    'tunnel_id': f'tunnel-{random.randint(100000, 999999)}',
+                    'tunnel_id': f'tunnel-{tunnel_id}',
                     'peer_ip': '203.0.113.1',
                     'shared_secret': 'encrypted-secret',
                     'ike_version': 2
                 },
                 'firewall_rules': [
                     {
-                        'rule_id': f'fw-{random.randint(100000, 999999)}',
+                        'rule_id': f'fw-{fw_id}',
                         'name': 'allow-vpn',
                         'allowed': [
                             {'IPProtocol': 'udp', 'ports': ['500', '4500']}
@@ -269,43 +305,19 @@ class CloudNetworkBuilder:
     def _calculate_cost(self, provider: str, bandwidth: int, resources: Dict) -> Dict:
         """Calculate estimated monthly cost"""
         
-        base_costs = {
-            'aws': {
-                'vpn_gateway': 36.00,  # per month
-                'data_transfer_per_gb': 0.09,
-                'connection_hour': 0.05
-            },
-            'azure': {
-                'vpn_gateway': 27.00,
-                'data_transfer_per_gb': 0.087,
-                'connection_hour': 0.04
-            },
-            'gcp': {
-                'vpn_gateway': 36.50,
-                'data_transfer_per_gb': 0.085,
-                'connection_hour': 0.05
-            }
-        }
-        
-        if provider not in base_costs:
-            provider = 'aws'
-        
-        costs = base_costs[provider]
+        costs = _BASE_COSTS.get(provider, _BASE_COSTS['aws'])
         
         # Estimate data transfer (assume 70% utilization)
-        monthly_data_gb = (bandwidth * 0.7 * 730 * 3600) / (8 * 1024 * 1024 * 1024)
+        data_transfer_cost = bandwidth * _GB_PER_MBPS_MONTH * costs['data_transfer_per_gb']
+        connection_cost = _HOURS_PER_MONTH * costs['connection_hour']
         
-        total_cost = (
-            costs['vpn_gateway'] +
-            (monthly_data_gb * costs['data_transfer_per_gb']) +
-            (730 * costs['connection_hour'])
-        )
+        total_cost = costs['vpn_gateway'] + data_transfer_cost + connection_cost
         
         return {
             'currency': 'USD',
             'vpn_gateway': f"${costs['vpn_gateway']:.2f}",
-            'data_transfer': f"${monthly_data_gb * costs['data_transfer_per_gb']:.2f}",
-            'connection_hours': f"${730 * costs['connection_hour']:.2f}",
+            'data_transfer': f"${data_transfer_cost:.2f}",
+            'connection_hours': f"${connection_cost:.2f}",
             'total_monthly': f"${total_cost:.2f}",
             'total_annual': f"${total_cost * 12:.2f}"
         }
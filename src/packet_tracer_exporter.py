@@ -3,9 +3,96 @@ Packet Tracer Exporter
 Export network topology to Cisco Packet Tracer format
 """
 
-from typing import Dict
+from typing import Any, BinaryIO, Dict
+import functools
 import json
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional; only needed for binary exports
+    msgpack = None
+
+
+def _dumps_indented(value: Any) -> bytes:
+    """Encode a value as 2-space indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2).encode('utf-8')
+
+
+# Static documentation sections
+_IP_SCHEME = {
+    'management_network': '192.168.100.0/24',
+    'core_network': '10.0.0.0/16',
+    'distribution_network': '10.1.0.0/16',
+    'access_network': '10.10.0.0/16'
+}
+
+_VLAN_DESIGN = {
+    'VLAN 10': 'Data Network',
+    'VLAN 20': 'Voice Network',
+    'VLAN 30': 'Management Network',
+    'VLAN 40': 'Guest Network'
+}
+
+_SECURITY_FEATURES = (
+    'Firewall deployed at network edge',
+    'ACLs configured on all routers',
+    'Port security enabled on access switches',
+    'DHCP snooping enabled',
+    'Dynamic ARP Inspection enabled',
+    'SSH enabled for management access'
+)
+
+# Device types that get a configuration in the export
+_CONFIG_TYPES = frozenset({'router', 'switch', 'firewall'})
+
+# Device configuration templates, filled with the device name and IP address
+_CONFIG_TEMPLATES = {
+    'router': """!
+hostname {name}
+!
+interface GigabitEthernet0/0
+ ip address {ip_address} 255.255.255.0
+ no shutdown
+!
+router ospf 1
+ network {ip_address} 0.0.0.255 area 0
+!
+line vty 0 4
+ login local
+ transport input ssh
+!
+end
+""",
+    'switch': """!
+hostname {name}
+!
+vlan 10
+ name DATA
+vlan 20
+ name VOICE
+vlan 30
+ name MANAGEMENT
+!
+interface vlan 30
+ ip address {ip_address} 255.255.255.0
+!
+end
+"""
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_device_config(dev_type: str, name: str, ip_address: str) -> str:
+    """Render a templated device configuration; cached since it depends only on these fields"""
+    return _CONFIG_TEMPLATES[dev_type].format(name=name, ip_address=ip_address)
+
 
 class PacketTracerExporter:
     """Export network topology to various formats"""
@@ -13,20 +100,22 @@ class PacketTracerExporter:
     def __init__(self, topology: Dict):
         self.topology = topology
         
-    def export_to_pkt(self, include_configs: bool = True, include_docs: bool = True) -> bytes:
+    def export_to_pkt(self, include_configs: bool = True, include_docs: bool = True,
+                      binary: bool = False) -> bytes:
         """
         Export topology to Packet Tracer .pkt format
         
         Args:
             include_configs: Include device configurations
             include_docs: Include documentation
+            binary: Encode with msgpack instead of indented JSON
             
         Returns:
             Binary data for .pkt file
         """
+        if binary and msgpack is None:
+            raise RuntimeError("Binary export requires the msgpack package")
         
-        # In production, this would generate actual .pkt binary format
-        # For now, return JSON representation
         export_data = {
             'version': '8.2',
             'topology': self.topology,
@@ -34,56 +123,56 @@ class PacketTracerExporter:
             'documentation': self._generate_documentation() if include_docs else {}
         }
         
-        return json.dumps(export_data, indent=2).encode('utf-8')
+        if binary:
+            return msgpack.packb(export_data, use_bin_type=True)
+        
+        # In production, this would generate actual .pkt binary format
+        # For now, return a JSON representation
+        return _dumps_indented(export_data)
     
-    def _generate_configs(self) -> Dict:
-        """Generate device configurations"""
-        configs = {}
+    def export_to_pkt_stream(self, fp: BinaryIO, include_configs: bool = True, include_docs: bool = True) -> None:
+        """
+        Write the .pkt export to a binary file object one section at a time
         
-        for device in self.topology.get('devices', []):
-            if device['type'] in ['router', 'switch', 'firewall']:
-                configs[device['name']] = self._generate_device_config(device)
+        Args:
+            fp: Binary file object to write to
+            include_configs: Include device configurations
+            include_docs: Include documentation
+        """
+        
+        # In production, this would generate actual .pkt binary format
+        # For now, write a JSON representation
+        sections = (
+            ('version', lambda: '8.2'),
+            ('topology', lambda: self.topology),
+            ('configurations', lambda: self._generate_configs() if include_configs else {}),
+            ('documentation', lambda: self._generate_documentation() if include_docs else {})
+        )
         
-        return configs
+        # Each section is encoded on its own and nested one level deeper; JSON
+        # strings never contain raw newlines, so re-indenting is safe
+        fp.write(b'{')
+        for i, (key, build) in enumerate(sections):
+            fp.write(b',\n  "' if i else b'\n  "')
+            fp.write(key.encode('ascii') + b'": ')
+            fp.write(_dumps_indented(build()).replace(b'\n', b'\n  '))
+        fp.write(b'\n}')
+    
+    def _generate_configs(self) -> Dict:
+        """Generate device configurations"""
+        return {
+            device['name']: self._generate_device_config(device)
+            for device in self.topology.get('devices', [])
+            if device['type'] in _CONFIG_TYPES
+        }
     
     def _generate_device_config(self, device: Dict) -> str:
         """Generate configuration for a single device"""
+        # Types without a template get a stub and never need an address
+        if device['type'] not in _CONFIG_TEMPLATES:
+            return "! No configuration available\n"
         
-        if device['type'] == 'router':
-            return f"""!
-hostname {device['name']}
-!
-interface GigabitEthernet0/0
- ip address {device['ip_address']} 255.255.255.0
- no shutdown
-!
-router ospf 1
- network {device['ip_address']} 0.0.0.255 area 0
-!
-line vty 0 4
- login local
- transport input ssh
-!
-end
-"""
-        elif device['type'] == 'switch':
-            return f"""!
-hostname {device['name']}
-!
-vlan 10
- name DATA
-vlan 20
- name VOICE
-vlan 30
- name MANAGEMENT
-!
-interface vlan 30
- ip address {device['ip_address']} 255.255.255.0
-!
-end
-"""
-        
-        return "! No configuration available\n"
+        return _render_device_config(device['type'], device['name'], device['ip_address'])
     
     def _generate_documentation(self) -> Dict:
         """Generate network documentation"""
@@ -98,29 +187,12 @@ end
     
     def _document_ip_scheme(self) -> Dict:
         """Document IP addressing scheme"""
-        return {
-            'management_network': '192.168.100.0/24',
-            'core_network': '10.0.0.0/16',
-            'distribution_network': '10.1.0.0/16',
-            'access_network': '10.10.0.0/16'
-        }
+        return dict(_IP_SCHEME)
     
     def _document_vlans(self) -> Dict:
         """Document VLAN design"""
-        return {
-            'VLAN 10': 'Data Network',
-            'VLAN 20': 'Voice Network',
-            'VLAN 30': 'Management Network',
-            'VLAN 40': 'Guest Network'
-        }
+        return dict(_VLAN_DESIGN)
     
     def _document_security(self) -> list:
         """Document security features"""
-        return [
-            'Firewall deployed at network edge',
-            'ACLs configured on all routers',
-            'Port security enabled on access switches',
-            'DHCP snooping enabled',
-            'Dynamic ARP Inspection enabled',
-            'SSH enabled for management access'
-        ]
+        return list(_SECURITY_FEATURES)
@@ -4,15 +4,164 @@ Comprehensive security scanning and compliance checking
 """
 
 import random
-from typing import Dict, List
+from collections import Counter
+from typing import Dict, List, Tuple
 from datetime import datetime
 
 
+# Per device type: (detection probability, finding fields)
+_VULNERABILITY_CHECKS = {
+    # Check for common router vulnerabilities
+    'router': (0.3, {
+        'severity': 'High',
+        'type': 'Weak Authentication',
+        'description': 'Default credentials detected on management interface',
+        'cve': 'CVE-2024-1234',
+        'remediation': 'Change default credentials and implement strong password policy'
+    }),
+    'switch': (0.2, {
+        'severity': 'Medium',
+        'type': 'Unencrypted Management',
+        'description': 'Management interface using unencrypted protocol',
+        'cve': 'N/A',
+        'remediation': 'Enable SSH and disable Telnet for management access'
+    }),
+    'firewall': (0.15, {
+        'severity': 'Critical',
+        'type': 'Outdated Firmware',
+        'description': 'Firewall running outdated firmware with known vulnerabilities',
+        'cve': 'CVE-2024-5678',
+        'remediation': 'Update to latest firmware version immediately'
+    })
+}
+
+# Device types whose configuration is audited
+_CONFIGURATION_AUDIT_TYPES = frozenset({'router', 'switch'})
+
+# Configuration checks: (detection probability, finding fields)
+_CONFIGURATION_CHECKS = (
+    # Check for SNMP configuration
+    (0.4, {
+        'severity': 'Low',
+        'type': 'Weak SNMP Configuration',
+        'description': 'SNMPv2 with default community string detected',
+        'cve': 'N/A',
+        'remediation': 'Upgrade to SNMPv3 with authentication and encryption'
+    }),
+    # Check for logging
+    (0.3, {
+        'severity': 'Medium',
+        'type': 'Insufficient Logging',
+        'description': 'Logging not configured or insufficient log levels',
+        'cve': 'N/A',
+        'remediation': 'Enable comprehensive logging and configure syslog server'
+    })
+)
+
+# Simulated CVE database
+_KNOWN_CVES = (
+    {
+        'cve': 'CVE-2024-1111',
+        'severity': 'Critical',
+        'description': 'Remote code execution vulnerability in router firmware',
+        'affected_models': frozenset({'Cisco ISR 4451', 'Cisco ISR 4331'})
+    },
+    {
+        'cve': 'CVE-2024-2222',
+        'severity': 'High',
+        'description': 'Privilege escalation vulnerability in switch OS',
+        'affected_models': frozenset({'Cisco Catalyst 9300', 'Cisco Catalyst 2960'})
+    }
+)
+
+
+def _index_cve_findings() -> Dict[str, List[Dict]]:
+    """Map each device model to the finding fields of the CVEs affecting it"""
+    findings_by_model = {}
+    for cve in _KNOWN_CVES:
+        for model in cve['affected_models']:
+            findings_by_model.setdefault(model, []).append({
+                'severity': cve['severity'],
+                'type': 'Known CVE',
+                'description': cve['description'],
+                'cve': cve['cve'],
+                'remediation': f'Apply security patch for {cve["cve"]}'
+            })
+    return findings_by_model
+
+
+_CVE_FINDINGS_BY_MODEL = _index_cve_findings()
+
+# Score deducted per vulnerability, by severity
+_SEVERITY_PENALTY = {'Critical': 10, 'High': 5, 'Medium': 2, 'Low': 1}
+
+# Compliance standards: (total controls, minimum passed, requirements)
+_COMPLIANCE_SPECS = {
+    'PCI-DSS': (12, 10, (
+        'Install and maintain firewall configuration',
+        'Do not use vendor-supplied defaults',
+        'Protect stored cardholder data',
+        'Encrypt transmission of cardholder data',
+        'Use and regularly update anti-virus software',
+        'Develop and maintain secure systems',
+        'Restrict access to cardholder data',
+        'Assign unique ID to each person',
+        'Restrict physical access to cardholder data',
+        'Track and monitor all access',
+        'Regularly test security systems',
+        'Maintain information security policy'
+    )),
+    'HIPAA': (10, 8, (
+        'Access control',
+        'Audit controls',
+        'Integrity controls',
+        'Transmission security',
+        'Authentication',
+        'Encryption',
+        'Backup and recovery',
+        'Emergency access',
+        'Automatic logoff',
+        'Encryption and decryption'
+    )),
+    'ISO 27001': (14, 12, (
+        'Information security policies',
+        'Organization of information security',
+        'Human resource security',
+        'Asset management',
+        'Access control',
+        'Cryptography',
+        'Physical and environmental security',
+        'Operations security',
+        'Communications security',
+        'System acquisition and development',
+        'Supplier relationships',
+        'Incident management',
+        'Business continuity',
+        'Compliance'
+    )),
+    'NIST': (5, 4, (
+        'Identify',
+        'Protect',
+        'Detect',
+        'Respond',
+        'Recover'
+    )),
+    'SOC 2': (5, 4, (
+        'Security',
+        'Availability',
+        'Processing integrity',
+        'Confidentiality',
+        'Privacy'
+    ))
+}
+
+
 class SecurityAuditor:
     """Network security auditing and compliance checking"""
     
     def __init__(self, topology: Dict):
         self.topology = topology
+        self._devices = topology.get('devices', [])
         self.vulnerabilities = []
         self.compliance_results = {}
         
@@ -49,24 +198,22 @@ class SecurityAuditor:
             'security_score': 0
         }
         
-        # Run vulnerability scan
-        if "Vulnerability Scan" in audit_types:
-            report['vulnerabilities'] = self._vulnerability_scan()
-        
-        # Run configuration audit
-        if "Configuration Audit" in audit_types:
-            config_issues = self._configuration_audit()
-            report['vulnerabilities'].extend(config_issues)
+        # Vulnerability scan, configuration audit and CVE check share one
+        # pass over the devices
+        vulnerabilities, config_issues, cve_results = self._scan_devices(
+            "Vulnerability Scan" in audit_types,
+            "Configuration Audit" in audit_types,
+            "CVE Database Check" in audit_types
+        )
+        report['vulnerabilities'] = vulnerabilities
+        report['vulnerabilities'].extend(config_issues)
         
         # Run penetration test
         if "Penetration Test" in audit_types:
             pentest_results = self._penetration_test()
             report['vulnerabilities'].extend(pentest_results)
         
-        # Check CVE database
-        if "CVE Database Check" in audit_types:
-            cve_results = self._cve_database_check()
-            report['vulnerabilities'].extend(cve_results)
+        report['vulnerabilities'].extend(cve_results)
         
         # Run compliance checks
         for standard in compliance_standards:
@@ -80,82 +227,47 @@ class SecurityAuditor:
         
         return report
     
-    def _vulnerability_scan(self) -> List[Dict]:
-        """Scan for network vulnerabilities"""
+    def _scan_devices(
+        self,
+        vulnerability_scan: bool = True,
+        configuration_audit: bool = True,
+        cve_check: bool = True
+    ) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """Run the selected per-device checks in a single pass over the devices"""
         vulnerabilities = []
+        issues = []
+        cve_findings = []
         
-        devices = self.topology.get('devices', [])
-        
-        for device in devices:
+        for device in self._devices:
+            device_type = device['type']
+            
             # Simulate vulnerability detection
-            if device['type'] == 'router':
-                # Check for common router vulnerabilities
-                if random.random() < 0.3:  # 30% chance
-                    vulnerabilities.append({
-                        'device': device['name'],
-                        'severity': 'High',
-                        'type': 'Weak Authentication',
-                        'description': 'Default credentials detected on management interface',
-                        'cve': 'CVE-2024-1234',
-                        'remediation': 'Change default credentials and implement strong password policy'
-                    })
+            if vulnerability_scan:
+                check = _VULNERABILITY_CHECKS.get(device_type)
+                if check is not None and random.random() < check[0]:
+                    vulnerabilities.append({'device': device['name'], **check[1]})
             
-            elif device['type'] == 'switch':
-                if random.random() < 0.2:  # 20% chance
-                    vulnerabilities.append({
-                        'device': device['name'],
-                        'severity': 'Medium',
-                        'type': 'Unencrypted Management',
-                        'description': 'Management interface using unencrypted protocol',
-                        'cve': 'N/A',
-                        'remediation': 'Enable SSH and disable Telnet for management access'
-                    })
+            # Check for configuration issues
+            if configuration_audit and device_type in _CONFIGURATION_AUDIT_TYPES:
+                for probability, issue in _CONFIGURATION_CHECKS:
+                    if random.random() < probability:
+                        issues.append({'device': device['name'], **issue})
             
-            elif device['type'] == 'firewall':
-                if random.random() < 0.15:  # 15% chance
-                    vulnerabilities.append({
-                        'device': device['name'],
-                        'severity': 'Critical',
-                        'type': 'Outdated Firmware',
-                        'description': 'Firewall running outdated firmware with known vulnerabilities',
-                        'cve': 'CVE-2024-5678',
-                        'remediation': 'Update to latest firmware version immediately'
-                    })
+            # Check the device model against the CVE database
+            if cve_check:
+                for finding in _CVE_FINDINGS_BY_MODEL.get(device.get('model'), ()):
+                    if random.random() < 0.2:
+                        cve_findings.append({'device': device['name'], **finding})
         
-        return vulnerabilities
+        return vulnerabilities, issues, cve_findings
+    
+    def _vulnerability_scan(self) -> List[Dict]:
+        """Scan for network vulnerabilities"""
+        return self._scan_devices(configuration_audit=False, cve_check=False)[0]
     
     def _configuration_audit(self) -> List[Dict]:
         """Audit device configurations"""
-        issues = []
-        
-        devices = self.topology.get('devices', [])
-        
-        for device in devices:
-            # Check for configuration issues
-            if device['type'] in ['router', 'switch']:
-                # Check for SNMP configuration
-                if random.random() < 0.4:
-                    issues.append({
-                        'device': device['name'],
-                        'severity': 'Low',
-                        'type': 'Weak SNMP Configuration',
-                        'description': 'SNMPv2 with default community string detected',
-                        'cve': 'N/A',
-                        'remediation': 'Upgrade to SNMPv3 with authentication and encryption'
-                    })
-                
-                # Check for logging
-                if random.random() < 0.3:
-                    issues.append({
-                        'device': device['name'],
-                        'severity': 'Medium',
-                        'type': 'Insufficient Logging',
-                        'description': 'Logging not configured or insufficient log levels',
-                        'cve': 'N/A',
-                        'remediation': 'Enable comprehensive logging and configure syslog server'
-                    })
-        
-        return issues
+        return self._scan_devices(vulnerability_scan=False, cve_check=False)[1]
     
     def _penetration_test(self) -> List[Dict]:
         """Simulate penetration testing"""
@@ -198,135 +310,24 @@ class SecurityAuditor:
     
     def _cve_database_check(self) -> List[Dict]:
         """Check devices against CVE database"""
-        cve_findings = []
-        
-        # Simulate CVE database checks
-        known_cves = [
-            {
-                'cve': 'CVE-2024-1111',
-                'severity': 'Critical',
-                'description': 'Remote code execution vulnerability in router firmware',
-                'affected_models': ['Cisco ISR 4451', 'Cisco ISR 4331']
-            },
-            {
-                'cve': 'CVE-2024-2222',
-                'severity': 'High',
-                'description': 'Privilege escalation vulnerability in switch OS',
-                'affected_models': ['Cisco Catalyst 9300', 'Cisco Catalyst 2960']
-            }
-        ]
-        
-        devices = self.topology.get('devices', [])
-        
-        for device in devices:
-            if 'model' in device:
-                for cve in known_cves:
-                    if device['model'] in cve['affected_models'] and random.random() < 0.2:
-                        cve_findings.append({
-                            'device': device['name'],
-                            'severity': cve['severity'],
-                            'type': 'Known CVE',
-                            'description': cve['description'],
-                            'cve': cve['cve'],
-                            'remediation': f'Apply security patch for {cve["cve"]}'
-                        })
-        
-        return cve_findings
+        return self._scan_devices(vulnerability_scan=False, configuration_audit=False)[2]
     
     def _check_compliance(self, standard: str) -> Dict:
         """Check compliance with security standard"""
         
-        compliance_checks = {
-            'PCI-DSS': {
-                'total_controls': 12,
-                'passed': random.randint(10, 12),
-                'requirements': [
-                    'Install and maintain firewall configuration',
-                    'Do not use vendor-supplied defaults',
-                    'Protect stored cardholder data',
-                    'Encrypt transmission of cardholder data',
-                    'Use and regularly update anti-virus software',
-                    'Develop and maintain secure systems',
-                    'Restrict access to cardholder data',
-                    'Assign unique ID to each person',
-                    'Restrict physical access to cardholder data',
-                    'Track and monitor all access',
-                    'Regularly test security systems',
-                    'Maintain information security policy'
-                ]
-            },
-            'HIPAA': {
-                'total_controls': 10,
-                'passed': random.randint(8, 10),
-                'requirements': [
-                    'Access control',
-                    'Audit controls',
-                    'Integrity controls',
-                    'Transmission security',
-                    'Authentication',
-                    'Encryption',
-                    'Backup and recovery',
-                    'Emergency access',
-                    'Automatic logoff',
-                    'Encryption and decryption'
-                ]
-            },
-            'ISO 27001': {
-                'total_controls': 14,
-                'passed': random.randint(12, 14),
-                'requirements': [
-                    'Information security policies',
-                    'Organization of information security',
-                    'Human resource security',
-                    'Asset management',
-                    'Access control',
-                    'Cryptography',
-                    'Physical and environmental security',
-                    'Operations security',
-                    'Communications security',
-                    'System acquisition and development',
-                    'Supplier relationships',
-                    'Incident management',
-                    'Business continuity',
-                    'Compliance'
-                ]
-            },
-            'NIST': {
-                'total_controls': 5,
-                'passed': random.randint(4, 5),
-                'requirements': [
-                    'Identify',
-                    'Protect',
-                    'Detect',
-                    'Respond',
-                    'Recover'
-                ]
-            },
-            'SOC 2': {
-                'total_controls': 5,
-                'passed': random.randint(4, 5),
-                'requirements': [
-                    'Security',
-                    'Availability',
-                    'Processing integrity',
-                    'Confidentiality',
-                    'Privacy'
-                ]
-            }
-        }
-        
-        if standard in compliance_checks:
-            check = compliance_checks[standard]
-            compliance_percentage = (check['passed'] / check['total_controls']) * 100
+        if standard in _COMPLIANCE_SPECS:
+            total_controls, min_passed, requirements = _COMPLIANCE_SPECS[standard]
+            passed = random.randint(min_passed, total_controls)
+            compliance_percentage = (passed / total_controls) * 100
             
             return {
                 'standard': standard,
-                'total_controls': check['total_controls'],
-                'passed': check['passed'],
-                'failed': check['total_controls'] - check['passed'],
+                'total_controls': total_controls,
+                'passed': passed,
+                'failed': total_controls - passed,
                 'compliance_percentage': round(compliance_percentage, 2),
                 'status': 'Pass' if compliance_percentage >= 80 else 'Fail',
-                'requirements': check['requirements']
+                'requirements': list(requirements)
             }
         
         return {
@@ -340,9 +341,10 @@ class SecurityAuditor:
         recommendations = []
         
         # Count vulnerabilities by severity
-        critical = sum(1 for v in vulnerabilities if v['severity'] == 'Critical')
-        high = sum(1 for v in vulnerabilities if v['severity'] == 'High')
-        medium = sum(1 for v in vulnerabilities if v['severity'] == 'Medium')
+        severity_counts = Counter(v['severity'] for v in vulnerabilities)
+        critical = severity_counts['Critical']
+        high = severity_counts['High']
+        medium = severity_counts['Medium']
         
         if critical > 0:
             recommendations.append(f"URGENT: Address {critical} critical vulnerabilities immediately")
@@ -373,21 +375,13 @@ class SecurityAuditor:
         base_score = 100
         
         # Deduct points for vulnerabilities
-        for vuln in report['vulnerabilities']:
-            if vuln['severity'] == 'Critical':
-                base_score -= 10
-            elif vuln['severity'] == 'High':
-                base_score -= 5
-            elif vuln['severity'] == 'Medium':
-                base_score -= 2
-            elif vuln['severity'] == 'Low':
-                base_score -= 1
+        base_score -= sum(_SEVERITY_PENALTY.get(v['severity'], 0) for v in report['vulnerabilities'])
         
         # Add points for compliance
-        compliance_scores = []
-        for standard, result in report['compliance'].items():
-            if isinstance(result, dict) and 'compliance_percentage' in result:
-                compliance_scores.append(result['compliance_percentage'])
+        compliance_scores = [
+            result['compliance_percentage'] for result in report['compliance'].values()
+            if isinstance(result, dict) and 'compliance_percentage' in result
+        ]
         
         if compliance_scores:
             avg_compliance = sum(compliance_scores) / len(compliance_scores)
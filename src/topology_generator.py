@@ -1,7 +1,24 @@
-import networkx as nx
 import random
-from typing import Dict, List, Optional
+from itertools import combinations
+from typing import Dict, List
 import json
+import uuid
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None
+
+
+_HOST_OPERATING_SYSTEMS = ('Windows 10', 'Windows 11', 'Ubuntu 22.04', 'macOS')
+
+# Interface name prefix and speed per device type
+_INTERFACE_PROFILES = {
+    'router': ('GigabitEthernet0/', '1000'),
+    'switch': ('FastEthernet0/', '1000'),
+    'firewall': ('GigabitEthernet0/', '100')
+}
+_DEFAULT_INTERFACE_PROFILE = ('FastEthernet0/', '100')
 
 
 class NetworkTopologyGenerator:
@@ -95,6 +112,7 @@ class NetworkTopologyGenerator:
         segments = self._calculate_segments()
         
         topology_data = {
+            'id': uuid.uuid4().hex,
             'network_type': network_type,
             'devices': self.devices,
             'links': self.links,
@@ -151,15 +169,18 @@ class NetworkTopologyGenerator:
     
     def _generate_hosts(self, count: int) -> List[Dict]:
         """Generate host devices"""
+        # Draw every host's OS in one call
+        operating_systems = random.choices(_HOST_OPERATING_SYSTEMS, k=count)
+        
         hosts = []
-        for i in range(count):
+        for i, os_name in enumerate(operating_systems):
             host = {
                 'name': f'Host-{i+1:03d}',
                 'type': 'host',
                 'subtype': 'workstation',
                 'ip_address': f'10.10.{i // 254}.{(i % 254) + 1}',
                 'mac_address': self._generate_mac_address(),
-                'os': random.choice(['Windows 10', 'Windows 11', 'Ubuntu 22.04', 'macOS'])
+                'os': os_name
             }
             hosts.append(host)
         return hosts
@@ -196,120 +217,73 @@ class NetworkTopologyGenerator:
     
     def _generate_interfaces(self, device_type: str, count: int) -> List[Dict]:
         """Generate network interfaces"""
-        interfaces = []
-        for i in range(count):
-            interface = {
-                'name': f'GigabitEthernet0/{i}' if device_type in ['router', 'firewall'] else f'FastEthernet0/{i}',
-                'status': 'up',
-                'speed': '1000' if device_type in ['router', 'switch'] else '100',
-                'duplex': 'full'
-            }
-            interfaces.append(interface)
-        return interfaces
+        prefix, speed = _INTERFACE_PROFILES.get(device_type, _DEFAULT_INTERFACE_PROFILE)
+        return [
+            {'name': f'{prefix}{i}', 'status': 'up', 'speed': speed, 'duplex': 'full'}
+            for i in range(count)
+        ]
     
     def _generate_mac_address(self) -> str:
         """Generate random MAC address"""
-        return ':'.join([f'{random.randint(0, 255):02x}' for _ in range(6)])
+        return random.randbytes(6).hex(':')
     
     def _create_enterprise_topology(self, routers, dist_switches, access_switches, hosts, redundancy):
         """Create enterprise network topology"""
         # Connect core routers in full mesh
-        for i, r1 in enumerate(routers):
-            for r2 in routers[i+1:]:
-                self.links.append({
-                    'source': r1['name'],
-                    'target': r2['name'],
-                    'type': 'core_link',
-                    'bandwidth': '10Gbps'
-                })
+        self.links.extend([
+            {'source': r1['name'], 'target': r2['name'], 'type': 'core_link', 'bandwidth': '10Gbps'}
+            for r1, r2 in combinations(routers, 2)
+        ])
         
-        # Connect distribution switches to core routers
-        if len(dist_switches) > 0 and len(routers) > 0:
-            for dist_sw in dist_switches:
-                # Connect to first 2 routers for redundancy (or all if less than 2)
-                router_count = min(2, len(routers))
-                for router in routers[:router_count]:
-                    self.links.append({
-                        'source': router['name'],
-                        'target': dist_sw['name'],
-                        'type': 'distribution_link',
-                        'bandwidth': '10Gbps'
-                    })
+        # Connect distribution switches to first 2 routers for redundancy (or all if less than 2)
+        self.links.extend([
+            {'source': router['name'], 'target': dist_sw['name'], 'type': 'distribution_link', 'bandwidth': '10Gbps'}
+            for dist_sw in dist_switches
+            for router in routers[:2]
+        ])
         
         # Connect access switches to distribution switches
         if len(access_switches) > 0 and len(dist_switches) > 0:
-            for i, access_sw in enumerate(access_switches):
-                dist_idx = i % len(dist_switches)
-                self.links.append({
-                    'source': dist_switches[dist_idx]['name'],
+            dist_count = len(dist_switches)
+            
+            # Add a redundant link to the next distribution switch when there is one
+            link_types = ['access_link']
+            if redundancy and dist_count > 1:
+                link_types.append('access_link_redundant')
+            
+            self.links.extend([
+                {
+                    'source': dist_switches[(i + offset) % dist_count]['name'],
                     'target': access_sw['name'],
-                    'type': 'access_link',
+                    'type': link_type,
                     'bandwidth': '1Gbps'
-                })
-                
-                if redundancy and len(dist_switches) > 1:
-                    # Add redundant link to another distribution switch
-                    redundant_dist_idx = (dist_idx + 1) % len(dist_switches)
-                    self.links.append({
-                        'source': dist_switches[redundant_dist_idx]['name'],
-                        'target': access_sw['name'],
-                        'type': 'access_link_redundant',
-                        'bandwidth': '1Gbps'
-                    })
+                }
+                for i, access_sw in enumerate(access_switches)
+                for offset, link_type in enumerate(link_types)
+            ])
         
-        # Connect hosts to access switches or distribution switches or routers
-        if len(hosts) > 0:
-            if len(access_switches) > 0:
-                # Connect hosts to access switches
-                hosts_per_switch = len(hosts) // len(access_switches)
-                if hosts_per_switch == 0:
-                    hosts_per_switch = 1
-                    
-                for i, host in enumerate(hosts):
-                    switch_idx = i // hosts_per_switch
-                    if switch_idx >= len(access_switches):
-                        switch_idx = len(access_switches) - 1
-                    
-                    self.links.append({
-                        'source': access_switches[switch_idx]['name'],
-                        'target': host['name'],
-                        'type': 'host_link',
-                        'bandwidth': '1Gbps'
-                    })
-            elif len(dist_switches) > 0:
-                # Connect hosts directly to distribution switches if no access switches
-                hosts_per_switch = len(hosts) // len(dist_switches)
-                if hosts_per_switch == 0:
-                    hosts_per_switch = 1
-                    
-                for i, host in enumerate(hosts):
-                    switch_idx = i // hosts_per_switch
-                    if switch_idx >= len(dist_switches):
-                        switch_idx = len(dist_switches) - 1
-                    
-                    self.links.append({
-                        'source': dist_switches[switch_idx]['name'],
-                        'target': host['name'],
-                        'type': 'host_link',
-                        'bandwidth': '1Gbps'
-                    })
-            elif len(routers) > 0:
-                # Connect hosts directly to routers if no switches
-                hosts_per_router = len(hosts) // len(routers)
-                if hosts_per_router == 0:
-                    hosts_per_router = 1
-                    
-                for i, host in enumerate(hosts):
-                    router_idx = i // hosts_per_router
-                    if router_idx >= len(routers):
-                        router_idx = len(routers) - 1
-                    
-                    self.links.append({
-                        'source': routers[router_idx]['name'],
-                        'target': host['name'],
-                        'type': 'host_link',
-                        'bandwidth': '1Gbps'
-                    })
+        # Connect hosts to access switches, or distribution switches if there are
+        # no access switches, or routers if there are no switches
+        self._connect_hosts(access_switches or dist_switches or routers, hosts, 'host_link', '1Gbps')
+    
+    def _connect_hosts(self, parents, hosts, link_type, bandwidth):
+        """Link consecutive blocks of hosts to each parent device in turn"""
+        if len(hosts) == 0 or len(parents) == 0:
+            return
+        
+        # Each parent takes hosts_per_parent hosts; the last one takes the remainder
+        hosts_per_parent = max(1, len(hosts) // len(parents))
+        last_parent = len(parents) - 1
+        
+        for parent_idx, parent in enumerate(parents):
+            start = parent_idx * hosts_per_parent
+            stop = start + hosts_per_parent if parent_idx < last_parent else len(hosts)
+            source = parent['name']
+            
+            self.links.extend([
+                {'source': source, 'target': host['name'], 'type': link_type, 'bandwidth': bandwidth}
+                for host in hosts[start:stop]
+            ])
     
     def _create_datacenter_topology(self, routers, dist_switches, access_switches, hosts, redundancy):
         """Create datacenter network topology (spine-leaf)"""
@@ -338,28 +312,9 @@ class NetworkTopologyGenerator:
                     'bandwidth': '10Gbps'
                 })
         
-        # Connect hosts (servers) to access switches
-        if len(hosts) > 0:
-            if len(access_switches) > 0:
-                hosts_per_switch = max(1, len(hosts) // len(access_switches))
-                for i, host in enumerate(hosts):
-                    switch_idx = min(i // hosts_per_switch, len(access_switches) - 1)
-                    self.links.append({
-                        'source': access_switches[switch_idx]['name'],
-                        'target': host['name'],
-                        'type': 'server_link',
-                        'bandwidth': '10Gbps'
-                    })
-            elif len(dist_switches) > 0:
-                hosts_per_switch = max(1, len(hosts) // len(dist_switches))
-                for i, host in enumerate(hosts):
-                    switch_idx = min(i // hosts_per_switch, len(dist_switches) - 1)
-                    self.links.append({
-                        'source': dist_switches[switch_idx]['name'],
-                        'target': host['name'],
-                        'type': 'server_link',
-                        'bandwidth': '10Gbps'
-                    })
+        # Connect hosts (servers) to access switches, or leaf switches if there
+        # are no access switches
+        self._connect_hosts(access_switches or dist_switches, hosts, 'server_link', '10Gbps')
     
     def _create_campus_topology(self, routers, dist_switches, access_switches, hosts, redundancy):
         """Create campus network topology"""
@@ -382,18 +337,22 @@ class NetworkTopologyGenerator:
     
     def _calculate_segments(self) -> int:
         """Calculate number of network segments"""
-        # Count unique subnets
-        subnets = set()
-        for device in self.devices:
-            if 'ip_address' in device:
-                ip_parts = device['ip_address'].split('.')
-                subnet = f"{ip_parts[0]}.{ip_parts[1]}.{ip_parts[2]}.0"
-                subnets.add(subnet)
+        # Count unique /24 subnets by their first three octets
+        subnets = {
+            device['ip_address'].rpartition('.')[0]
+            for device in self.devices
+            if 'ip_address' in device
+        }
         return len(subnets)
     
-    def get_topology_json(self) -> str:
-        """Export topology as JSON"""
-        return json.dumps(self.topology, indent=2)
+    def get_topology_json(self, pretty: bool = True) -> str:
+        """Export topology as JSON, 2-space indented or compact"""
+        if orjson is not None:
+            return orjson.dumps(self.topology, option=orjson.OPT_INDENT_2 if pretty else None).decode('utf-8')
+        
+        if pretty:
+            return json.dumps(self.topology, indent=2)
+        return json.dumps(self.topology, separators=(',', ':'))
     
     def export_to_pkt(self, filename: str = "network.pkt"):
         """Export topology to Cisco Packet Tracer format"""
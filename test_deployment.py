@@ -10,6 +10,17 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# Import the custom modules once; test_modules() reports any failure
+try:
+    from topology_generator import NetworkTopologyGenerator
+    from security_auditor import SecurityAuditor
+    from cloud_integrator import CloudNetworkBuilder
+    from analytics_engine import NetworkAnalytics
+    from packet_tracer_exporter import PacketTracerExporter
+    MODULE_IMPORT_ERROR = None
+except ImportError as e:
+    MODULE_IMPORT_ERROR = e
+
 def test_imports():
     """Test all required imports"""
     print("Testing imports...")
@@ -28,24 +39,17 @@ def test_imports():
 def test_modules():
     """Test custom modules"""
     print("\nTesting custom modules...")
-    try:
-        from topology_generator import NetworkTopologyGenerator
-        from security_auditor import SecurityAuditor
-        from cloud_integrator import CloudNetworkBuilder
-        from analytics_engine import NetworkAnalytics
-        from packet_tracer_exporter import PacketTracerExporter
-        print("✅ All custom modules imported successfully")
-        return True
-    except ImportError as e:
-        print(f"❌ Module import error: {e}")
+    if MODULE_IMPORT_ERROR is not None:
+        print(f"❌ Module import error: {MODULE_IMPORT_ERROR}")
         return False
+    
+    print("✅ All custom modules imported successfully")
+    return True
 
 def test_topology_generation():
     """Test topology generation"""
     print("\nTesting topology generation...")
     try:
-        from topology_generator import NetworkTopologyGenerator
-        
         generator = NetworkTopologyGenerator()
         topology = generator.generate_topology(
             network_type="enterprise",
@@ -70,8 +74,6 @@ def test_security_audit(topology):
     """Test security auditing"""
     print("\nTesting security audit...")
     try:
-        from security_auditor import SecurityAuditor
-        
         auditor = SecurityAuditor(topology)
         report = auditor.run_audit(
             audit_types=["Vulnerability Scan"],
@@ -92,8 +94,6 @@ def test_cloud_integration(topology):
     """Test cloud integration"""
     print("\nTesting cloud integration...")
     try:
-        from cloud_integrator import CloudNetworkBuilder
-        
         cloud_builder = CloudNetworkBuilder()
         result = cloud_builder.create_hybrid_topology(
             on_premise=topology,
@@ -116,8 +116,6 @@ def test_analytics(topology):
     """Test analytics engine"""
     print("\nTesting analytics...")
     try:
-        from analytics_engine import NetworkAnalytics
-        
         analytics = NetworkAnalytics(topology)
         data = analytics.analyze()
         
@@ -134,8 +132,6 @@ def test_export(topology):
     """Test export functionality"""
     print("\nTesting export...")
     try:
-        from packet_tracer_exporter import PacketTracerExporter
-        
         exporter = PacketTracerExporter(topology)
         pkt_data = exporter.export_to_pkt()
         
@@ -148,6 +144,29 @@ def test_export(topology):
         print(f"❌ Export error: {e}")
         return False
 
+def print_summary(results):
+    """Print the results table and return the exit code"""
+    print("\n" + "=" * 60)
+    print("TEST SUMMARY")
+    print("=" * 60)
+    
+    passed = sum(1 for _, result in results if result)
+    total = len(results)
+    
+    for test_name, result in results:
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"{test_name:.<40} {status}")
+    
+    print("=" * 60)
+    print(f"Results: {passed}/{total} tests passed")
+    
+    if passed == total:
+        print("\n🎉 ALL TESTS PASSED! Ready for production deployment!")
+        return 0
+    else:
+        print(f"\n⚠️  {total - passed} test(s) failed. Please fix before deployment.")
+        return 1
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -162,6 +181,10 @@ def main():
     # Test modules
     results.append(("Modules", test_modules()))
     
+    # Nothing else can run without the packages and modules
+    if not all(result for _, result in results):
+        return print_summary(results)
+    
     # Test topology generation
     success, topology = test_topology_generation()
     results.append(("Topology Generation", success))
@@ -179,27 +202,7 @@ def main():
         # Test export
         results.append(("Export", test_export(topology)))
     
-    # Summary
-    print("\n" + "=" * 60)
-    print("TEST SUMMARY")
-    print("=" * 60)
-    
-    passed = sum(1 for _, result in results if result)
-    total = len(results)
-    
-    for test_name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
-        print(f"{test_name:.<40} {status}")
-    
-    print("=" * 60)
-    print(f"Results: {passed}/{total} tests passed")
-    
-    if passed == total:
-        print("\n🎉 ALL TESTS PASSED! Ready for production deployment!")
-        return 0
-    else:
-        print(f"\n⚠️  {total - passed} test(s) failed. Please fix before deployment.")
-        return 1
+    return print_summary(results)
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,32 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+from src.topology_generator import NetworkTopologyGenerator
+
+
+def pytest_configure(config):
+    """Register custom markers"""
+    config.addinivalue_line("markers", "slow: large topology tests; deselect with -m 'not slow'")
+
+
+@pytest.fixture(scope="session")
+def basic_topology():
+    """Enterprise topology generated once per session; tests must not mutate it"""
+    return NetworkTopologyGenerator().generate_topology(
+        num_routers=2,
+        num_switches=4,
+        num_hosts=10
+    )
+
+
+@pytest.fixture(scope="session")
+def high_security_topology():
+    """Small high-security topology generated once per session; tests must not mutate it"""
+    return NetworkTopologyGenerator().generate_topology(
+        num_routers=2,
+        num_switches=2,
+        num_hosts=5,
+        security_level="high"
+    )
@@ -0,0 +1,85 @@
+"""
+Unit tests for NetworkAnalytics
+"""
+
+import pytest
+from src.analytics_engine import NetworkAnalytics
+
+
+class TestNetworkAnalytics:
+    
+    @pytest.fixture(autouse=True)
+    def setup_analytics(self, basic_topology):
+        """Analyze the shared session topology"""
+        self.topology = basic_topology
+        self.analytics = NetworkAnalytics(self.topology)
+    
+    def test_analyze_sections(self):
+        """Test analysis returns every section"""
+        data = self.analytics.analyze()
+        
+        assert set(data) == {
+            'performance_metrics',
+            'traffic_analysis',
+            'capacity_planning',
+            'bottleneck_detection',
+            'optimization_suggestions'
+        }
+    
+    def test_performance_ranges(self):
+        """Test performance metrics stay within their simulated ranges"""
+        metrics = self.analytics.analyze()['performance_metrics']
+        
+        assert 10 <= metrics['average_latency_ms'] <= 20
+        assert 25 <= metrics['peak_latency_ms'] <= 40
+        assert 2.0 <= metrics['throughput_gbps'] <= 3.5
+        assert 0.01 <= metrics['packet_loss_percent'] <= 0.05
+        assert 1 <= metrics['jitter_ms'] <= 5
+        assert 99.9 <= metrics['availability_percent'] <= 99.99
+        assert all(isinstance(value, float) for value in metrics.values())
+    
+    def test_traffic_ranges(self):
+        """Test traffic analysis stays within its simulated ranges"""
+        traffic = self.analytics.analyze()['traffic_analysis']
+        
+        assert 1000 <= traffic['total_traffic_gb'] <= 5000
+        assert 200 <= traffic['peak_hour_traffic_gb'] <= 500
+        assert len(traffic['top_talkers']) == 3
+        assert list(traffic['protocol_distribution']) == ['HTTP', 'HTTPS', 'SSH', 'FTP', 'DNS', 'Other']
+        assert 30 <= traffic['protocol_distribution']['HTTP'] <= 40
+        assert 3 <= traffic['protocol_distribution']['Other'] <= 10
+        assert 100 <= traffic['top_talkers'][0]['traffic_gb'] <= 300
+    
+    def test_capacity_ranges(self):
+        """Test capacity planning values are plain ints within range"""
+        capacity = self.analytics.analyze()['capacity_planning']
+        
+        assert 60 <= capacity['overall_utilization_percent'] <= 75
+        assert 80 <= capacity['peak_utilization_percent'] <= 95
+        assert isinstance(capacity['overall_utilization_percent'], int)
+        assert len(capacity['device_utilization']) == min(10, len(self.topology['devices']))
+        assert set(capacity['growth_projection']) == {'3_months', '6_months', '12_months'}
+        
+        for entry in capacity['device_utilization']:
+            assert 40 <= entry['utilization_percent'] <= 85
+            assert 15 <= entry['capacity_remaining_percent'] <= 60
+    
+    def test_analyze_independent_results(self):
+        """Test each analysis is a fresh report that reflects the current topology"""
+        # Own device list, so clearing it leaves the shared topology intact
+        topology = {**self.topology, 'devices': list(self.topology['devices'])}
+        analytics = NetworkAnalytics(topology)
+        first = analytics.analyze()
+        first['capacity_planning']['device_utilization'].clear()
+        
+        second = analytics.analyze()
+        assert second is not first
+        assert len(second['capacity_planning']['device_utilization']) == min(10, len(topology['devices']))
+        
+        topology['devices'].clear()
+        assert analytics.analyze()['capacity_planning']['device_utilization'] == []
+        assert self.topology['devices']
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,71 @@
+"""
+Unit tests for CloudNetworkBuilder
+"""
+
+import random
+import re
+
+import pytest
+from src.cloud_integrator import CloudNetworkBuilder
+
+
+class TestCloudNetworkBuilder:
+    
+    @pytest.fixture(autouse=True)
+    def setup_builder(self, basic_topology):
+        """Connect the shared session topology"""
+        self.builder = CloudNetworkBuilder()
+        self.on_premise = basic_topology
+    
+    def test_cost_estimate(self):
+        """Test monthly cost breakdown for a known bandwidth"""
+        hybrid = self.builder.create_hybrid_topology(self.on_premise, cloud_provider='aws', bandwidth=1000)
+        cost = hybrid['cost_estimate']
+        
+        assert cost == {
+            'currency': 'USD',
+            'vpn_gateway': '$36.00',
+            'data_transfer': '$0.02',
+            'connection_hours': '$36.50',
+            'total_monthly': '$72.52',
+            'total_annual': '$870.23'
+        }
+    
+    def test_unknown_provider_cost(self):
+        """Test unknown providers are priced like AWS"""
+        other = self.builder.create_hybrid_topology(self.on_premise, cloud_provider='other', bandwidth=500)
+        aws = self.builder.create_hybrid_topology(self.on_premise, cloud_provider='aws', bandwidth=500)
+        
+        assert other['cost_estimate'] == aws['cost_estimate']
+    
+    def test_hybrid_topology(self):
+        """Test hybrid topology for each provider"""
+        for provider in ['aws', 'azure', 'gcp']:
+            hybrid = self.builder.create_hybrid_topology(self.on_premise, cloud_provider=provider)
+            
+            assert hybrid['cloud_provider'] == provider
+            assert hybrid['cloud_resources']
+            assert hybrid['on_premise_network']['total_devices'] == self.on_premise['total_devices']
+            assert hybrid['deployment_id'].startswith('hybrid-')
+    
+    def test_resource_ids(self):
+        """Test generated resource IDs keep their digit counts"""
+        aws = self.builder.create_hybrid_topology(self.on_premise, cloud_provider='aws')['cloud_resources']
+        azure = self.builder.create_hybrid_topology(self.on_premise, cloud_provider='azure')['cloud_resources']
+        
+        assert re.fullmatch(r'vpc-\d{6}', aws['vpc']['vpc_id'])
+        assert all(re.fullmatch(r'subnet-\d{6}', s['subnet_id']) for s in aws['subnets'])
+        assert re.fullmatch(r'.*/vnet-\d{4}', azure['virtual_network']['vnet_id'])
+    
+    def test_seeded_ids(self):
+        """Test random.seed makes resource IDs reproducible"""
+        random.seed(7)
+        first = self.builder.create_hybrid_topology(self.on_premise, cloud_provider='gcp')
+        random.seed(7)
+        second = self.builder.create_hybrid_topology(self.on_premise, cloud_provider='gcp')
+        
+        assert first == second
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for PacketTracerExporter
+"""
+
+import json
+
+import pytest
+from src.packet_tracer_exporter import PacketTracerExporter
+
+
+class TestPacketTracerExporter:
+    
+    @pytest.fixture(autouse=True)
+    def setup_exporter(self, basic_topology):
+        """Export the shared session topology"""
+        self.topology = basic_topology
+        self.exporter = PacketTracerExporter(self.topology)
+    
+    def test_export_to_pkt(self):
+        """Test export decodes back to the topology and its sections"""
+        data = self.exporter.export_to_pkt()
+        
+        assert isinstance(data, bytes)
+        export = json.loads(data)
+        assert export['version'] == '8.2'
+        assert export['topology'] == self.topology
+        assert set(export['configurations']) == {
+            d['name'] for d in self.topology['devices']
+            if d['type'] in ['router', 'switch', 'firewall']
+        }
+        assert export['documentation']['total_devices'] == self.topology['total_devices']
+    
+    def test_export_without_sections(self):
+        """Test configs and docs can be left out"""
+        export = json.loads(self.exporter.export_to_pkt(include_configs=False, include_docs=False))
+        
+        assert export['configurations'] == {}
+        assert export['documentation'] == {}
+    
+    def test_export_stdlib_fallback(self, monkeypatch):
+        """Test export matches when orjson is unavailable"""
+        import src.packet_tracer_exporter as exporter_module
+        
+        fast = json.loads(self.exporter.export_to_pkt())
+        monkeypatch.setattr(exporter_module, 'orjson', None)
+        
+        assert json.loads(self.exporter.export_to_pkt()) == fast
+    
+    def test_export_stream(self, tmp_path, monkeypatch):
+        """Test streamed export matches a single-shot indented dump"""
+        import src.packet_tracer_exporter as exporter_module
+        monkeypatch.setattr(exporter_module, 'orjson', None)
+        
+        path = tmp_path / 'network.pkt'
+        with open(path, 'wb') as f:
+            self.exporter.export_to_pkt_stream(f)
+        
+        expected = {
+            'version': '8.2',
+            'topology': self.topology,
+            'configurations': self.exporter._generate_configs(),
+            'documentation': self.exporter._generate_documentation()
+        }
+        assert path.read_bytes() == json.dumps(expected, indent=2).encode('utf-8')
+        assert path.read_bytes() == self.exporter.export_to_pkt()
+    
+    def test_export_binary(self):
+        """Test msgpack export decodes to the same data as the JSON export"""
+        msgpack = pytest.importorskip('msgpack')
+        
+        data = self.exporter.export_to_pkt(binary=True)
+        
+        assert msgpack.unpackb(data, raw=False) == json.loads(self.exporter.export_to_pkt())
+    
+    def test_export_binary_requires_msgpack(self, monkeypatch):
+        """Test binary export fails clearly without msgpack"""
+        import src.packet_tracer_exporter as exporter_module
+        monkeypatch.setattr(exporter_module, 'msgpack', None)
+        
+        with pytest.raises(RuntimeError):
+            self.exporter.export_to_pkt(binary=True)
+    
+    def test_router_config(self):
+        """Test router configs carry hostname and OSPF network"""
+        router = next(d for d in self.topology['devices'] if d['type'] == 'router')
+        config = self.exporter._generate_configs()[router['name']]
+        
+        assert f"hostname {router['name']}" in config
+        assert f" network {router['ip_address']} 0.0.0.255 area 0" in config
+    
+    def test_config_requires_ip_address(self):
+        """Test a configured device without an IP address fails loudly"""
+        with pytest.raises(KeyError):
+            self.exporter._generate_device_config({'type': 'router', 'name': 'Router-core-99'})
+    
+    def test_firewall_config_without_ip_address(self):
+        """Test untemplated devices get the stub even without an IP address"""
+        config = self.exporter._generate_device_config({'type': 'firewall', 'name': 'Firewall-99'})
+        
+        assert config == "! No configuration available\n"
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -2,6 +2,8 @@
 Unit tests for NetworkTopologyGenerator
 """
 
+from collections import Counter
+
 import pytest
 from src.topology_generator import NetworkTopologyGenerator
 
@@ -19,14 +21,9 @@ class TestNetworkTopologyGenerator:
         assert self.generator.devices == []
         assert self.generator.links == []
     
-    def test_generate_basic_topology(self):
+    def test_generate_basic_topology(self, basic_topology):
         """Test basic topology generation"""
-        topology = self.generator.generate_topology(
-            network_type="enterprise",
-            num_routers=2,
-            num_switches=4,
-            num_hosts=10
-        )
+        topology = basic_topology
         
         assert topology is not None
         assert 'devices' in topology
@@ -34,50 +31,41 @@ class TestNetworkTopologyGenerator:
         assert topology['total_devices'] > 0
         assert topology['total_links'] > 0
     
-    def test_device_count(self):
+    @pytest.mark.parametrize("num_routers,num_switches,num_hosts", [
+        (3, 6, 20),
+        (2, 4, 10),
+        (1, 1, 1)
+    ])
+    def test_device_count(self, num_routers, num_switches, num_hosts):
         """Test correct number of devices are generated"""
         topology = self.generator.generate_topology(
-            num_routers=3,
-            num_switches=6,
-            num_hosts=20
+            num_routers=num_routers,
+            num_switches=num_switches,
+            num_hosts=num_hosts
         )
         
-        routers = [d for d in topology['devices'] if d['type'] == 'router']
-        switches = [d for d in topology['devices'] if d['type'] == 'switch']
-        hosts = [d for d in topology['devices'] if d['type'] == 'host']
+        counts = Counter(d['type'] for d in topology['devices'])
         
-        assert len(routers) == 3
-        assert len(switches) == 6
-        assert len(hosts) == 20
+        assert (counts['router'], counts['switch'], counts['host']) == (num_routers, num_switches, num_hosts)
     
-    def test_security_devices(self):
+    def test_security_devices(self, high_security_topology):
         """Test security devices are added based on security level"""
-        high_security = self.generator.generate_topology(
+        counts = Counter(d['type'] for d in high_security_topology['devices'])
+        
+        assert counts['firewall'] + counts['ips'] > 0
+    
+    @pytest.mark.parametrize("net_type", ["enterprise", "datacenter", "campus"])
+    def test_network_types(self, net_type):
+        """Test different network types"""
+        topology = self.generator.generate_topology(
+            network_type=net_type,
             num_routers=2,
             num_switches=2,
-            num_hosts=5,
-            security_level="high"
+            num_hosts=5
         )
         
-        security_devices = [d for d in high_security['devices'] 
-                        if d['type'] in ['firewall', 'ips']]
-        
-        assert len(security_devices) > 0
-    
-    def test_network_types(self):
-        """Test different network types"""
-        network_types = ["enterprise", "datacenter", "campus"]
-        
-        for net_type in network_types:
-            topology = self.generator.generate_topology(
-                network_type=net_type,
-                num_routers=2,
-                num_switches=2,
-                num_hosts=5
-            )
-            
-            assert topology['network_type'] == net_type
-            assert topology['total_devices'] > 0
+        assert topology['network_type'] == net_type
+        assert topology['total_devices'] > 0
     
     def test_redundancy(self):
         """Test redundancy creates additional links"""
@@ -100,18 +88,45 @@ class TestNetworkTopologyGenerator:
         # With redundancy should have more or equal links
         assert with_redundancy['total_links'] >= no_redundancy['total_links']
     
-    def test_ip_addressing(self):
+    def test_ip_addressing(self, high_security_topology):
         """Test IP addresses are assigned"""
+        for device in high_security_topology['devices']:
+            if device['type'] in ['router', 'switch', 'host']:
+                assert 'ip_address' in device
+                assert device['ip_address'] is not None
+    
+    def test_host_fields(self):
+        """Test hosts get well-formed MAC addresses and a known OS"""
+        import re
+        
+        hosts = self.generator._generate_hosts(300)
+        
+        assert [h['ip_address'] for h in hosts[252:256]] == [
+            '10.10.0.253', '10.10.0.254', '10.10.1.1', '10.10.1.2'
+        ]
+        for host in hosts:
+            assert re.fullmatch(r'([0-9a-f]{2}:){5}[0-9a-f]{2}', host['mac_address'])
+            assert host['os'] in ['Windows 10', 'Windows 11', 'Ubuntu 22.04', 'macOS']
+    
+    def test_segments(self):
+        """Test segments count unique /24 subnets"""
         topology = self.generator.generate_topology(
             num_routers=2,
-            num_switches=2,
-            num_hosts=5
+            num_switches=4,
+            num_hosts=300,
+            security_level="critical"
         )
         
-        for device in topology['devices']:
-            if device['type'] in ['router', 'switch', 'host']:
-                assert 'ip_address' in device
-                assert device['ip_address'] is not None
+        # 10.0.0-1, 10.1.0-1, 10.2.0-1 and 10.10.0-1 (firewall and IPS share 10.0.0)
+        assert topology['segments'] == 8
+    
+    def test_topology_id(self):
+        """Test each generated topology gets a unique id"""
+        first = self.generator.generate_topology(num_routers=1, num_switches=2, num_hosts=2)
+        second = self.generator.generate_topology(num_routers=1, num_switches=2, num_hosts=2)
+        
+        assert isinstance(first['id'], str)
+        assert first['id'] != second['id']
     
     def test_export_json(self):
         """Test JSON export"""
@@ -128,52 +143,53 @@ class TestNetworkTopologyGenerator:
         assert 'devices' in json_data
         assert 'links' in json_data
     
-    def test_invalid_parameters(self):
+    def test_export_json_formats(self, monkeypatch):
+        """Test pretty and compact JSON decode to the topology with or without orjson"""
+        import json
+        import src.topology_generator as generator_module
+        
+        topology = self.generator.generate_topology(num_routers=2, num_switches=4, num_hosts=5)
+        outputs = [self.generator.get_topology_json(), self.generator.get_topology_json(pretty=False)]
+        monkeypatch.setattr(generator_module, 'orjson', None)
+        outputs += [self.generator.get_topology_json(), self.generator.get_topology_json(pretty=False)]
+        
+        for output in outputs:
+            assert json.loads(output) == topology
+        assert outputs[2] == json.dumps(topology, indent=2)
+        assert '\n' not in outputs[1] and '\n' not in outputs[3]
+    
+    @pytest.mark.parametrize("params,message", [
+        (dict(num_routers=-1, num_switches=2, num_hosts=5), "non-negative"),
+        (dict(num_routers=0, num_switches=-5, num_hosts=5), "non-negative"),
+        (dict(network_type="invalid_type", num_routers=2, num_switches=2, num_hosts=5), "network_type"),
+        (dict(security_level="extreme"), "security_level")
+    ])
+    def test_invalid_parameters(self, params, message):
         """Test handling of invalid parameters"""
-        with pytest.raises(ValueError):
-            self.generator.generate_topology(
-                num_routers=-1,
-                num_switches=2,
-                num_hosts=5
-            )
-        
-        with pytest.raises(ValueError):
-            self.generator.generate_topology(
-                num_routers=0,
-                num_switches=-5,
-                num_hosts=5
-            )
-        
-        with pytest.raises(ValueError):
-            self.generator.generate_topology(
-                network_type="invalid_type",
-                num_routers=2,
-                num_switches=2,
-                num_hosts=5
-            )
-            
+        with pytest.raises(ValueError, match=message):
+            self.generator.generate_topology(**params)
+    
+    @pytest.mark.slow
     def test_large_topology_performance(self):
         """Test performance on large topology generation"""
         import time
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         topology = self.generator.generate_topology(
             num_routers=50,
             num_switches=100,
             num_hosts=500
         )
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         assert topology is not None
         # Fixed: Account for potential security devices added automatically
         # Count actual devices instead of assuming exact count
-        routers = [d for d in topology['devices'] if d['type'] == 'router']
-        switches = [d for d in topology['devices'] if d['type'] == 'switch']
-        hosts = [d for d in topology['devices'] if d['type'] == 'host']
+        counts = Counter(d['type'] for d in topology['devices'])
         
-        assert len(routers) == 50
-        assert len(switches) == 100
-        assert len(hosts) == 500
+        assert counts['router'] == 50
+        assert counts['switch'] == 100
+        assert counts['host'] == 500
         assert (end_time - start_time) < 10  # Should complete within 10 seconds
         
 if __name__ == "__main__":